@@ -71,8 +71,8 @@ for /d %%D in ("%PROFILE_DIR%\*") do (
             if !errorlevel! equ 0 (
                 echo Deleting old profile folder: !profile_name!
 
-                REM Wait a moment to ensure no locks
-                timeout /t 1 /nobreak >nul 2>&1
+                REM Wait a moment to ensure no locks (ping works with redirected stdin)
+                ping -n 2 127.0.0.1 >nul 2>&1
 
                 REM Delete the directory recursively (folder only)
                 rmdir /s /q "%%D" >nul 2>&1
@@ -17,7 +17,8 @@ if not exist "%PROFILE_DIR%" (
 )
 
 REM Wait 2 seconds to ensure Chrome has fully released file locks
-timeout /t 2 /nobreak >NUL 2>&1
+REM (ping instead of timeout: timeout fails when stdin is redirected)
+ping -n 3 127.0.0.1 >NUL 2>&1
 
 REM Remove the profile directory recursively and quietly
 rmdir /s /q "%PROFILE_DIR%" >NUL 2>&1
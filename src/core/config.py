@@ -37,6 +37,11 @@ class Settings:
     browser_api_callback_timeout: int = int(
         os.getenv("BROWSER_API_CALLBACK_TIMEOUT", "30")
     )
+    # Coalesce non-success callbacks arriving within this window into one POST
+    # carrying a JSON array (0 = disabled, every callback is sent on its own)
+    browser_api_callback_batch_ms: int = int(
+        os.getenv("BROWSER_API_CALLBACK_BATCH_MS", "0")
+    )
 
     # Chrome Launcher Configuration
     use_custom_chrome_launcher: bool = (
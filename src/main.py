@@ -85,6 +85,7 @@ class BrowserAutomationLauncher:
         """Detect and cache IP addresses at startup"""
         logger.info("Detecting and caching IP addresses...")
 
+        temp_launcher = None
         try:
             # Create temporary browser launcher instance just to use its IP detection methods
             temp_launcher = BrowserLauncher()
@@ -121,6 +122,10 @@ class BrowserAutomationLauncher:
             self.cached_machine_ip = "127.0.0.1"
             self.cached_public_ip = "127.0.0.1"
             self.is_aws_vm = False
+        finally:
+            # Close the temporary launcher's shared HTTP session
+            if temp_launcher and temp_launcher._http and not temp_launcher._http.closed:
+                await temp_launcher._http.close()
 
     async def start(self):
         """Start the browser automation launcher"""
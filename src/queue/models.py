@@ -1,6 +1,8 @@
+import time
 import uuid
 from datetime import UTC, datetime
 from enum import Enum
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -61,9 +63,12 @@ class BrowserSession(BaseModel):
     debug_port: int
     process_id: int | None = None
     process_create_time: float | None = None  # For PID-reuse validation
+    process_name: str | None = None  # Lowercased, for PID-reuse validation
     user_data_dir: str
     status: str = "active"
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    # Monotonic start tick for age/duration math (created_at is for display)
+    created_at_monotonic: float = Field(default_factory=time.monotonic, exclude=True)
     expires_at: datetime
     websocket_url: str
     debug_url: str
@@ -77,6 +82,27 @@ class BrowserSession(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
         arbitrary_types_allowed = True
 
+    # created_at/expires_at never change after creation - format them once
+    @cached_property
+    def created_at_iso(self) -> str:
+        return self.created_at.isoformat()
+
+    @cached_property
+    def expires_at_iso(self) -> str:
+        return self.expires_at.isoformat()
+
+    @cached_property
+    def summary(self) -> dict:
+        """API-facing view, built once per session (all its fields are immutable)"""
+        return {
+            "worker_id": self.worker_id,
+            "request_id": self.request_id,
+            "debug_port": self.debug_port,
+            "machine_ip": self.machine_ip,
+            "created_at": self.created_at_iso,
+            "expires_at": self.expires_at_iso,
+        }
+
 
 class TerminatedSession(BaseModel):
     """Information about terminated browser sessions"""
@@ -10,6 +10,12 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Platform doesn't change at runtime - resolve once at import
+_SYSTEM = platform.system().lower()
+
+# IMDS reachability doesn't change during process lifetime - probe once
+_is_aws_vm_cached: bool | None = None
+
 
 def _is_aws_vm_sync() -> bool:
     """Synchronous AWS check - only call from thread"""
@@ -25,8 +31,11 @@ def _is_aws_vm_sync() -> bool:
 
 
 async def _is_aws_vm() -> bool:
-    """Check if running on AWS VM (async version)"""
-    return await asyncio.to_thread(_is_aws_vm_sync)
+    """Check if running on AWS VM (async version, cached after first probe)"""
+    global _is_aws_vm_cached
+    if _is_aws_vm_cached is None:
+        _is_aws_vm_cached = await asyncio.to_thread(_is_aws_vm_sync)
+    return _is_aws_vm_cached
 
 
 async def is_browser_alive(
@@ -98,20 +107,15 @@ def _is_port_in_use_sync(
 ) -> bool:
     """Synchronous port check - only call from thread"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
             result = sock.connect_ex((host, port))
-            sock.close()
 
-            if result == 0:
-                logger.debug(f"Port {port} is in use on {host}")
-                return True
-            else:
-                logger.debug(f"Port {port} is free on {host}")
-                return False
-        except Exception:
-            sock.close()
+        if result == 0:
+            logger.debug(f"Port {port} is in use on {host}")
+            return True
+        else:
+            logger.debug(f"Port {port} is free on {host}")
             return False
 
     except Exception as e:
@@ -147,7 +151,7 @@ async def cleanup_windows_port_forwarding(port: int) -> bool:
     Returns:
         True if cleanup initiated successfully, False otherwise
     """
-    if platform.system().lower() != "windows":
+    if _SYSTEM != "windows":
         logger.debug("Windows port forwarding cleanup skipped (not Windows)")
         return True
 
@@ -203,7 +207,7 @@ async def cleanup_linux_port_forwarding(port: int) -> bool:
     Returns:
         True if cleanup successful, False otherwise
     """
-    if platform.system().lower() != "linux":
+    if _SYSTEM != "linux":
         logger.debug("Linux port forwarding cleanup skipped (not Linux)")
         return True
 
@@ -300,7 +304,7 @@ async def cleanup_macos_port_forwarding(port: int) -> bool:
     Returns:
         True if cleanup successful, False otherwise
     """
-    if platform.system().lower() != "darwin":
+    if _SYSTEM != "darwin":
         logger.debug("macOS port forwarding cleanup skipped (not macOS)")
         return True
 
@@ -349,21 +353,20 @@ async def force_cleanup_port_and_proxy(port: int) -> tuple[bool, bool, bool]:
 
         # Clean up proxy/port forwarding based on OS
         # Only cleanup if on AWS VM (where port forwarding is needed)
-        system = platform.system().lower()
         proxy_cleaned = False
 
         if await _is_aws_vm():
             logger.debug(
                 f"AWS VM detected - cleaning up port forwarding for port {port}"
             )
-            if system == "windows":
+            if _SYSTEM == "windows":
                 proxy_cleaned = await cleanup_windows_port_forwarding(port)
-            elif system == "linux":
+            elif _SYSTEM == "linux":
                 proxy_cleaned = await cleanup_linux_port_forwarding(port)
-            elif system == "darwin":
+            elif _SYSTEM == "darwin":
                 proxy_cleaned = await cleanup_macos_port_forwarding(port)
             else:
-                logger.warning(f"Unsupported OS for port forwarding cleanup: {system}")
+                logger.warning(f"Unsupported OS for port forwarding cleanup: {_SYSTEM}")
                 proxy_cleaned = True  # Skip on unsupported OS
         else:
             logger.debug("Not on AWS VM - skipping port forwarding cleanup")
@@ -460,16 +463,14 @@ async def find_orphaned_port_mappings(port_range: tuple[int, int]) -> list[int]:
     orphaned_ports = []
 
     try:
-        system = platform.system().lower()
-
-        if system == "windows":
+        if _SYSTEM == "windows":
             orphaned_ports = await _find_orphaned_windows_ports(port_range)
-        elif system == "linux":
+        elif _SYSTEM == "linux":
             orphaned_ports = await _find_orphaned_linux_ports(port_range)
-        elif system == "darwin":
+        elif _SYSTEM == "darwin":
             orphaned_ports = await _find_orphaned_macos_ports(port_range)
         else:
-            logger.debug(f"Orphaned port detection not supported on {system}")
+            logger.debug(f"Orphaned port detection not supported on {_SYSTEM}")
 
         if orphaned_ports:
             logger.debug(
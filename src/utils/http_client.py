@@ -15,6 +15,7 @@ async def send_post_request(
     data: dict[str, Any],
     timeout: int = 30,
     headers: dict[str, str] | None = None,
+    session: aiohttp.ClientSession | None = None,
 ) -> tuple[bool, int | None, str]:
     """
     Send async POST request to URL
@@ -24,6 +25,8 @@ async def send_post_request(
         data: JSON data to send
         timeout: Request timeout in seconds (default: 30)
         headers: Optional HTTP headers
+        session: Optional shared session to reuse pooled connections
+            (a temporary session is created if omitted)
 
     Returns:
         Tuple of (success: bool, status_code: int | None, response_text: str)
@@ -32,27 +35,32 @@ async def send_post_request(
         logger.warning("Empty URL provided to send_post_request")
         return False, None, "Empty URL"
 
+    async def _post(http: aiohttp.ClientSession) -> tuple[bool, int | None, str]:
+        async with http.post(
+            url,
+            json=data,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response_text = await response.text()
+            success = 200 <= response.status < 300
+
+            if success:
+                logger.debug(
+                    f"POST request successful | URL: {url} | Status: {response.status}"
+                )
+            else:
+                logger.warning(
+                    f"POST request failed | URL: {url} | Status: {response.status} | Response: {response_text[:200]}"
+                )
+
+            return success, response.status, response_text
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                json=data,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as response:
-                response_text = await response.text()
-                success = 200 <= response.status < 300
-
-                if success:
-                    logger.debug(
-                        f"POST request successful | URL: {url} | Status: {response.status}"
-                    )
-                else:
-                    logger.warning(
-                        f"POST request failed | URL: {url} | Status: {response.status} | Response: {response_text[:200]}"
-                    )
-
-                return success, response.status, response_text
+        if session is not None and not session.closed:
+            return await _post(session)
+        async with aiohttp.ClientSession() as own_session:
+            return await _post(own_session)
 
     except asyncio.TimeoutError:
         logger.error(f"POST request timeout after {timeout}s | URL: {url}")
@@ -71,6 +79,7 @@ async def send_get_request(
     url: str,
     timeout: int = 30,
     headers: dict[str, str] | None = None,
+    session: aiohttp.ClientSession | None = None,
 ) -> tuple[bool, int | None, str]:
     """
     Send async GET request to URL
@@ -79,6 +88,8 @@ async def send_get_request(
         url: Target URL
         timeout: Request timeout in seconds (default: 30)
         headers: Optional HTTP headers
+        session: Optional shared session to reuse pooled connections
+            (a temporary session is created if omitted)
 
     Returns:
         Tuple of (success: bool, status_code: int | None, response_text: str)
@@ -87,26 +98,31 @@ async def send_get_request(
         logger.warning("Empty URL provided to send_get_request")
         return False, None, "Empty URL"
 
+    async def _get(http: aiohttp.ClientSession) -> tuple[bool, int | None, str]:
+        async with http.get(
+            url,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response_text = await response.text()
+            success = 200 <= response.status < 300
+
+            if success:
+                logger.debug(
+                    f"GET request successful | URL: {url} | Status: {response.status}"
+                )
+            else:
+                logger.warning(
+                    f"GET request failed | URL: {url} | Status: {response.status} | Response: {response_text[:200]}"
+                )
+
+            return success, response.status, response_text
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=timeout),
-            ) as response:
-                response_text = await response.text()
-                success = 200 <= response.status < 300
-
-                if success:
-                    logger.debug(
-                        f"GET request successful | URL: {url} | Status: {response.status}"
-                    )
-                else:
-                    logger.warning(
-                        f"GET request failed | URL: {url} | Status: {response.status} | Response: {response_text[:200]}"
-                    )
-
-                return success, response.status, response_text
+        if session is not None and not session.closed:
+            return await _get(session)
+        async with aiohttp.ClientSession() as own_session:
+            return await _get(own_session)
 
     except asyncio.TimeoutError:
         logger.error(f"GET request timeout after {timeout}s | URL: {url}")
@@ -1,12 +1,21 @@
 """Utility to manage Windows port reservations and IP Helper service conflicts"""
 
+import functools
 import platform
 import subprocess
+import time
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Platform doesn't change at runtime - resolve once at import
+_IS_WINDOWS = platform.system().lower() == "windows"
+
+# Cached netsh excluded port ranges: (timestamp, ranges)
+_EXCLUDED_RANGES_TTL = 30.0
+_ranges_cache: tuple[float, list[tuple[int, int]]] | None = None
+
 
 def ensure_ports_available(start_port: int, end_port: int) -> bool:
     """
@@ -20,10 +29,16 @@ def ensure_ports_available(start_port: int, end_port: int) -> bool:
     Returns:
         True if ports are available or conflicts resolved, False otherwise
     """
-    if platform.system().lower() != "windows":
+    if not _IS_WINDOWS:
         logger.debug("Port manager only runs on Windows")
         return True
 
+    # Without admin rights the IP Helper service can't be disabled anyway,
+    # so skip spawning netsh to look for conflicts we couldn't resolve
+    if not check_admin_privileges():
+        logger.debug("Not running as Administrator - skipping port exclusion probe")
+        return True
+
     try:
         # Check if IP Helper service is running and blocking ports
         if _is_ip_helper_blocking_ports(start_port, end_port):
@@ -54,43 +69,73 @@ def ensure_ports_available(start_port: int, end_port: int) -> bool:
         return True
 
 
+def _get_excluded_ranges() -> list[tuple[int, int]] | None:
+    """
+    Get TCP excluded port ranges reported by netsh.
+    Results are cached for 30 seconds so repeated checks don't re-spawn netsh.
+
+    Returns:
+        List of (range_start, range_end) tuples, or None if netsh failed
+    """
+    global _ranges_cache
+
+    if (
+        _ranges_cache is not None
+        and time.monotonic() - _ranges_cache[0] < _EXCLUDED_RANGES_TTL
+    ):
+        return _ranges_cache[1]
+
+    result = subprocess.run(
+        ["netsh", "int", "ipv4", "show", "excludedportrange", "protocol=tcp"],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+    if result.returncode != 0:
+        return None
+
+    ranges = []
+    for line in result.stdout.split("\n"):
+        parts = line.split()
+        if len(parts) >= 2:
+            try:
+                ranges.append((int(parts[0]), int(parts[1])))
+            except ValueError:
+                continue
+
+    _ranges_cache = (time.monotonic(), ranges)
+    return ranges
+
+
+def _invalidate_excluded_ranges():
+    """Drop cached excluded port ranges (call after changing IP Helper state)"""
+    global _ranges_cache
+    _ranges_cache = None
+
+
 def _is_ip_helper_blocking_ports(start_port: int, end_port: int) -> bool:
     """Check if IP Helper service has reserved the port range"""
     try:
         # Check excluded port ranges
-        result = subprocess.run(
-            ["netsh", "int", "ipv4", "show", "excludedportrange", "protocol=tcp"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        ranges = _get_excluded_ranges()
 
-        if result.returncode != 0:
+        if ranges is None:
             logger.debug("Could not check excluded port ranges")
             return False
 
-        # Parse output to find if our port range is excluded
-        lines = result.stdout.split("\n")
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 2:
-                try:
-                    range_start = int(parts[0])
-                    range_end = int(parts[1])
-
-                    # Check if our port range overlaps with excluded range
-                    if (
-                        range_start <= start_port <= range_end
-                        or range_start <= end_port <= range_end
-                        or (start_port <= range_start and end_port >= range_end)
-                    ):
-                        logger.info(
-                            f"Found port exclusion: {range_start}-{range_end} "
-                            f"overlapping with {start_port}-{end_port}"
-                        )
-                        return True
-                except (ValueError, IndexError):
-                    continue
+        # Find if our port range overlaps with an excluded range
+        for range_start, range_end in ranges:
+            if (
+                range_start <= start_port <= range_end
+                or range_start <= end_port <= range_end
+                or (start_port <= range_start and end_port >= range_end)
+            ):
+                logger.info(
+                    f"Found port exclusion: {range_start}-{range_end} "
+                    f"overlapping with {start_port}-{end_port}"
+                )
+                return True
 
         return False
 
@@ -108,26 +153,18 @@ def _disable_ip_helper_service() -> bool:
         True if successful, False otherwise
     """
     try:
-        logger.info("Attempting to stop IP Helper service (iphlpsvc)...")
+        logger.info("Stopping and disabling IP Helper service (iphlpsvc)...")
 
-        # Stop the service
+        # Stop and disable in one process instead of separate net stop + sc config
+        # Stop errors are ignored since the service might already be stopped
         result = subprocess.run(
-            ["net", "stop", "iphlpsvc", "/y"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-
-        if result.returncode != 0:
-            # Service might already be stopped
-            logger.debug(f"Stop service result: {result.stderr}")
-        else:
-            logger.info("IP Helper service stopped successfully")
-
-        # Disable the service - FIXED: removed space between start= and disabled
-        logger.info("Disabling IP Helper service permanently...")
-        result = subprocess.run(
-            ["sc", "config", "iphlpsvc", "start=disabled"],
+            [
+                "powershell",
+                "-NoProfile",
+                "-Command",
+                "Stop-Service iphlpsvc -Force -ErrorAction SilentlyContinue; "
+                "Set-Service iphlpsvc -StartupType Disabled",
+            ],
             capture_output=True,
             text=True,
             timeout=30,
@@ -135,6 +172,7 @@ def _disable_ip_helper_service() -> bool:
 
         if result.returncode == 0:
             logger.info("IP Helper service disabled successfully")
+            _invalidate_excluded_ranges()
 
             # Delete existing port exclusions created by IP Helper
             logger.info("Cleaning up port exclusions...")
@@ -146,7 +184,13 @@ def _disable_ip_helper_service() -> bool:
             )
             return True
         else:
-            logger.warning(f"Failed to disable IP Helper service: {result.stderr}")
+            error_msg = (result.stderr or result.stdout or "").strip()
+            if "denied" in error_msg.lower():
+                logger.warning(
+                    "Failed to disable IP Helper service: Administrator privileges required"
+                )
+            else:
+                logger.warning(f"Failed to disable IP Helper service: {error_msg}")
             return False
 
     except subprocess.TimeoutExpired:
@@ -167,34 +211,21 @@ def _delete_port_exclusions() -> bool:
     """
     try:
         # Check if there are any exclusions in our port range
-        result = subprocess.run(
-            ["netsh", "int", "ipv4", "show", "excludedportrange", "protocol=tcp"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        ranges = _get_excluded_ranges()
 
-        if result.returncode != 0:
+        if ranges is None:
             logger.debug("Could not check port exclusions")
             return True
 
         # Port exclusions are automatically removed when IP Helper is stopped
         # But we log what we found
         exclusions_found = False
-        lines = result.stdout.split("\n")
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 2:
-                try:
-                    range_start = int(parts[0])
-                    range_end = int(parts[1])
-                    if 9200 <= range_start <= 9350 or 9200 <= range_end <= 9350:
-                        logger.info(
-                            f"Found port exclusion in our range: {range_start}-{range_end}"
-                        )
-                        exclusions_found = True
-                except (ValueError, IndexError):
-                    continue
+        for range_start, range_end in ranges:
+            if 9200 <= range_start <= 9350 or 9200 <= range_end <= 9350:
+                logger.info(
+                    f"Found port exclusion in our range: {range_start}-{range_end}"
+                )
+                exclusions_found = True
 
         if not exclusions_found:
             logger.info("No port exclusions found in Chrome port range (9200-9350)")
@@ -210,16 +241,18 @@ def _delete_port_exclusions() -> bool:
         return True  # Don't fail the application
 
 
+@functools.cache
 def check_admin_privileges() -> bool:
-    """Check if running with administrator privileges on Windows"""
-    if platform.system().lower() != "windows":
+    """
+    Check if running with administrator privileges on Windows.
+    Result is cached since admin status doesn't change within a process run.
+    """
+    if not _IS_WINDOWS:
         return True
 
     try:
-        # Try to read from a protected registry key
-        import winreg
+        import ctypes
 
-        with winreg.OpenKey(winreg.HKEY_USERS, "S-1-5-19"):
-            return True
-    except (ImportError, OSError):
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
         return False
@@ -50,8 +50,13 @@ class SQSClientManager:
                 logger.warning(
                     f"SQS client for {region_name} has {self._failure_counts[key]} failures - reinitializing"
                 )
-                if key in self._clients:
-                    del self._clients[key]
+                # Close the old client so its connection pool releases sockets now
+                old_client = self._clients.pop(key, None)
+                if old_client is not None:
+                    try:
+                        await asyncio.to_thread(old_client.close)
+                    except Exception:
+                        logger.debug("Error closing old SQS client", exc_info=True)
                 self._failure_counts[key] = 0
 
             # Create new client if needed
@@ -1,15 +1,18 @@
 import asyncio
 import json
+import logging
 import os
 import platform
-import random
 import re
+import secrets
 import shutil
+import signal
 import socket
+import stat
 import subprocess
 import tempfile
 import time
-import uuid
+from collections import deque
 from datetime import UTC, datetime, timedelta
 from typing import Optional, Union
 
@@ -29,15 +32,329 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Platform doesn't change at runtime - resolve once at import
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM == "windows"
+
+# Launcher window flags are the same for every spawn (Popen copies it per call)
+_WIN_STARTUPINFO = None
+if _IS_WINDOWS:
+    _WIN_STARTUPINFO = subprocess.STARTUPINFO()
+    _WIN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+# Helper BAT scripts live in <project root>/scripts - resolve once at import
+_SCRIPTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "scripts",
+)
+
+
+# Allowed characters for a caller-supplied profile directory name
+_DIR_NAME_RE = re.compile(r"\A[A-Za-z0-9_-]+\Z")
+# Launcher-created (temporary) profile dirs, matched in a single scan
+_TEMP_PROFILE_RE = re.compile(r"chrome_profile_|Chrome-RDP")
+
+
+# Static Chrome flags for every non-custom launch (per-launch flags added separately)
+_BASE_CHROME_ARGS: tuple[str, ...] = (
+    "--remote-debugging-address=0.0.0.0",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--enable-automation",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--disable-prompt-on-repost",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--no-service-autorun",
+    "--password-store=basic",
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-breakpad",
+    "--disable-component-update",
+    "--disable-domain-reliability",
+    "--disable-features=OptimizationHints,MediaRouter",
+    "--disable-client-side-phishing-detection",
+)
+
+# Caller-supplied chrome_args validation (built once, not per launch)
+_DANGEROUS_CHROME_ARGS = frozenset(
+    {
+        "--disable-web-security",
+        "--allow-file-access-from-files",
+        "--allow-file-access",
+        "--allow-running-insecure-content",
+        "--disable-site-isolation-trials",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-namespace-sandbox",
+        "--disable-seccomp-filter-sandbox",
+        "--allow-sandbox-debugging",
+        "--enable-logging",
+        "--log-file",
+        "--enable-dbus",
+        "--remote-debugging-address",
+        "--remote-debugging-port",
+        "--user-data-dir",
+        "--crash-dumps-dir",
+        "--homedir",
+        "--disk-cache-dir",
+        "--enable-local-file-accesses",
+        "--unlimited-storage",
+        "--allow-cross-origin-auth-prompt",
+        "--password-store",
+        "--enable-automation",
+    }
+)
+_SAFE_ARG_RE = re.compile(r"^--[a-z0-9\-]+(=[a-z0-9\-_\.,:/]+)?$", re.IGNORECASE)
+_PATH_WORDS = ("dir", "path", "file")
+_URL_PROTOS = ("http://", "https://", "file://", "ftp://")
+
+# Page URLs that don't count as real content in activity checks
+_BLANK_URLS = frozenset(
+    {"about:blank", "chrome://newtab/", "chrome://new-tab-page/", "", "data:"}
+)
+
+
+def _resolve_bat_script(name: str) -> Optional[str]:
+    path = os.path.join(_SCRIPTS_DIR, name)
+    return path if os.path.exists(path) else None
+
+
+_BAT_SCRIPTS: dict[str, Optional[str]] = {
+    name: _resolve_bat_script(name)
+    for name in (
+        "cleanup_profile.bat",
+        "cleanup_expired_session.bat",
+        "cleanup_old_profiles.bat",
+    )
+}
+
+
+def _prepare_default_user_data_dir(debug_port: int) -> str:
+    """
+    Pick and create the default profile directory for a port.
+    Runs all filesystem work in one call so the launch path needs a single thread hop.
+    """
+    if _IS_WINDOWS and settings.use_custom_chrome_launcher:
+        basedir = os.path.dirname(settings.chrome_launcher_cmd)
+        if not basedir or basedir == ".":
+            basedir = r"C:\Chrome-RDP"
+        user_data_dir = os.path.join(basedir, f"p{debug_port}")
+    else:
+        user_data_dir = os.path.join(
+            tempfile.gettempdir(), f"chrome_profile_p{debug_port}"
+        )
+    # makedirs creates the base directory along the way
+    os.makedirs(user_data_dir, exist_ok=True)
+    return user_data_dir
+
+
+def _first_executable(paths: list[str]) -> str | None:
+    """Return the first path that is an executable file (one stat per candidate)"""
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+            return path
+        logger.warning(f"Chrome found at {path} but is not executable")
+    return None
+
+
+def _inspect_process(pid: int) -> tuple[psutil.Process, str]:
+    """Build a psutil.Process and read its name with one batched process query"""
+    proc = psutil.Process(pid)
+    with proc.oneshot():
+        return proc, proc.name().lower()
+
+
+def _verify_session_process(
+    pid: int,
+    create_time: float | None,
+    name: str | None,
+    port_token: str,
+) -> psutil.Process | None:
+    """
+    Return the psutil.Process for pid if it is still the session's browser.
+    All identity fields are read in one oneshot() batch; None means the PID
+    was reused (or can't be matched) and must not be killed.
+    """
+    proc = psutil.Process(pid)
+    with proc.oneshot():
+        if create_time is not None:
+            time_diff = abs(proc.create_time() - create_time)
+            if time_diff > 1.0:
+                logger.warning(
+                    f"PID {pid} create_time changed (diff: {time_diff:.2f}s) - "
+                    f"skipping aggressive kill to avoid PID-reuse race"
+                )
+                return None
+            return proc
+
+        # Conservative fallback: only kill if name and cmdline match our instance
+        proc_name = proc.name().lower()
+        if name:
+            name_ok = proc_name == name
+        else:
+            name_ok = proc_name.startswith(("chrome", "msedge"))
+        if not (name_ok and port_token in " ".join(proc.cmdline())):
+            logger.warning(
+                f"PID {pid} has no stored create_time and fallback guards failed - "
+                f"skipping aggressive kill to avoid potential PID-reuse race"
+            )
+            return None
+
+    logger.info(
+        f"PID {pid} has no create_time but name/cmdline match - "
+        f"proceeding with aggressive kill"
+    )
+    return proc
+
+
+def _find_listener_pid_windows(port: int) -> int | None:
+    """
+    Find the PID listening on a local IPv4 port via GetExtendedTcpTable.
+    Asks the kernel for listeners only (TCP_TABLE_OWNER_PID_LISTENER), so the
+    table is small and already carries owning PIDs - no full connection scan.
+    Raises OSError if the table can't be read.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    af_inet = 2
+    tcp_table_owner_pid_listener = 3
+    error_insufficient_buffer = 122
+
+    class MibTcpRowOwnerPid(ctypes.Structure):
+        _fields_ = [
+            ("dwState", wintypes.DWORD),
+            ("dwLocalAddr", wintypes.DWORD),
+            ("dwLocalPort", wintypes.DWORD),
+            ("dwRemoteAddr", wintypes.DWORD),
+            ("dwRemotePort", wintypes.DWORD),
+            ("dwOwningPid", wintypes.DWORD),
+        ]
+
+    get_table = ctypes.windll.iphlpapi.GetExtendedTcpTable
+    size = wintypes.DWORD(0)
+    buf = None
+    for _ in range(3):
+        buf = ctypes.create_string_buffer(size.value or 1)
+        ret = get_table(
+            buf, ctypes.byref(size), False, af_inet, tcp_table_owner_pid_listener, 0
+        )
+        if ret == 0:
+            break
+        if ret != error_insufficient_buffer:
+            raise OSError(f"GetExtendedTcpTable failed with error {ret}")
+    else:
+        raise OSError("GetExtendedTcpTable buffer kept growing")
+
+    count = wintypes.DWORD.from_buffer(buf).value
+    rows = (MibTcpRowOwnerPid * count).from_buffer(buf, ctypes.sizeof(wintypes.DWORD))
+    # Loopback/any only - the portproxy listener on the LAN IP belongs to iphlpsvc
+    chrome_addrs = (b"\x7f\x00\x00\x01", b"\x00\x00\x00\x00")
+    for row in rows:
+        # Address and port are stored in network byte order
+        if (
+            socket.ntohs(row.dwLocalPort & 0xFFFF) == port
+            and row.dwOwningPid
+            and row.dwLocalAddr.to_bytes(4, "little") in chrome_addrs
+        ):
+            return row.dwOwningPid
+    return None
+
+
+# os.kill with any signal is TerminateProcess on Windows; SIGKILL is POSIX-only
+_KILL_SIGNAL = signal.SIGTERM if _IS_WINDOWS else signal.SIGKILL
+
+
+def _kill_process_tree(proc: psutil.Process):
+    """
+    Kill a process's children, then the process itself, in one call.
+    Child PIDs are snapshotted first and signalled directly, skipping
+    psutil's per-process validation. PIDs already gone are ignored.
+    """
+    try:
+        pids = [child.pid for child in proc.children(recursive=True)]
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pids = []
+    pids.append(proc.pid)
+
+    for pid in pids:
+        try:
+            os.kill(pid, _KILL_SIGNAL)
+        except OSError:
+            pass
+
+
+async def _wait_for_pid_exit(pid: int, timeout: float) -> bool:
+    """
+    Wait for a PID to disappear, checking at once and then backing off from
+    20ms (doubling, capped at 0.5s). Returns True once it's gone.
+    """
+    deadline = time.monotonic() + timeout
+    interval = 0.02
+    while await asyncio.to_thread(psutil.pid_exists, pid):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, 0.5)
+    return True
+
+
+class LauncherProcess:
+    """Popen-style poll/terminate/kill facade over an asyncio subprocess"""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self._process = process
+        self.pid = process.pid
+
+    @property
+    def returncode(self):
+        return self._process.returncode
+
+    def poll(self):
+        return self._process.returncode
+
+    async def wait(self) -> int:
+        """Wait for exit without polling (woken by the event loop's child watcher)"""
+        return await self._process.wait()
+
+    def terminate(self):
+        try:
+            self._process.terminate()
+        except ProcessLookupError:
+            pass
+
+    def kill(self):
+        try:
+            self._process.kill()
+        except ProcessLookupError:
+            pass
+
 
 class ChromeProcessWrapper:
     def __init__(
-        self, chrome_process: psutil.Process, launcher_process: subprocess.Popen
+        self,
+        chrome_process: psutil.Process,
+        launcher_process: Union[subprocess.Popen, LauncherProcess],
     ):
         self.chrome_process = chrome_process
         self.launcher_process = launcher_process
         self.pid = chrome_process.pid
         self.returncode = None
+        self._last_poll = 0.0  # monotonic time of the last "still running" answer
+        self.devtools_ready = False  # set once the launcher has probed DevTools
 
     def _poll_sync(self):
         try:
@@ -53,7 +370,17 @@ class ChromeProcessWrapper:
             return self.returncode
 
     async def poll(self):
-        return await asyncio.to_thread(self._poll_sync)
+        # Exit is final, and a "running" answer is reused for 50ms so back-to-back
+        # polls from cleanup code don't each hop to a thread
+        if self.returncode is not None:
+            return self.returncode
+        if time.monotonic() - self._last_poll < 0.05:
+            return None
+        # run_in_executor skips to_thread's contextvars copy on this hot path
+        result = await asyncio.get_running_loop().run_in_executor(None, self._poll_sync)
+        if result is None:
+            self._last_poll = time.monotonic()
+        return result
 
     def terminate(self):
         try:
@@ -86,85 +413,212 @@ class ChromeProcessWrapper:
     def communicate(self):
         return (b"", b"")
 
+    @staticmethod
+    def sweep(wrappers: list["ChromeProcessWrapper"]):
+        """
+        Refresh the exit state of many wrappers in one pass (call via a thread).
+        Exited wrappers get their returncode; live ones get a fresh "running"
+        answer, so the per-session poll() right after needs no thread hop.
+        """
+        by_proc = {id(w.chrome_process): w for w in wrappers}
+        gone, alive = psutil.wait_procs([w.chrome_process for w in wrappers], timeout=0)
+        now = time.monotonic()
+        for proc in gone:
+            wrapper = by_proc[id(proc)]
+            if wrapper.returncode is None:
+                wrapper.returncode = proc.returncode or 0
+        for proc in alive:
+            by_proc[id(proc)]._last_poll = now
+
 
 class BrowserLauncher:
     """Launches browser sessions as separate processes with slot management"""
 
     def __init__(self):
         self.sessions: dict[str, BrowserSession] = {}
-        self.terminated_sessions: list[TerminatedSession] = []
+        # Copy-on-write view of sessions.values(), rebuilt under _session_lock on
+        # every add/remove so readers never iterate the live dict
+        self._sessions_snapshot: tuple[BrowserSession, ...] = ()
+        self._max_terminated_history = 50
+        # Bounded history - the deque evicts the oldest entry on append
+        self.terminated_sessions: deque[TerminatedSession] = deque(
+            maxlen=self._max_terminated_history
+        )
+        # Latest history entry per worker, kept in step with the deque
+        self._terminated_by_worker: dict[str, TerminatedSession] = {}
 
         self._session_lock = asyncio.Lock()
         self._port_lock = asyncio.Lock()
-        self._used_ports: set = set()
-        self._max_terminated_history = 50
         self._last_orphan_cleanup = None
 
         self._cached_machine_ip: str | None = None
         self._cached_public_ip: str | None = None
         self._is_aws_vm_cached: bool | None = None
+        self._public_ip_expiry: float = 0.0
+
+        # IMDSv2 token is valid for 6h - reuse it instead of a PUT per lookup
+        self._imds_token: str | None = None
+        self._imds_token_expiry: float = 0.0
+
+        # Chrome install path is stable - rediscover at most once an hour
+        self._chrome_exe_cache: str | None = None
+        self._chrome_exe_expiry: float = 0.0
+        self._chrome_exe_ttl = 3600.0
+        self._chrome_exe_lock = asyncio.Lock()
+
+        # Resolved allowed bases for user_data_dir, keyed on the launcher settings
+        self._allowed_bases_key: tuple | None = None
+        self._allowed_bases_real: list[str] = []
+        self._allowed_base_prefixes: tuple[str, ...] = ()  # Each base + os.sep
+        self._allowed_bases_lock = asyncio.Lock()
+
+        # In-flight DevTools readiness probes per port: later callers await the
+        # running probe's result instead of starting their own probe loop
+        self._devtools_waiters: dict[int, asyncio.Future] = {}
+
+        # Recent listener PID lookups: {port: (pid, monotonic time)}, short TTL
+        self._pid_port_cache: dict[int, tuple[int, float]] = {}
+        self._pid_port_cache_ttl = 5.0
+
+        # Pending batched callbacks: (payload, future resolved with the POST result)
+        self._callback_queue: list[tuple[dict, asyncio.Future]] = []
+        self._callback_flush_task: asyncio.Task | None = None
+
+        # Linux/Mac profile deletions go through a bounded queue drained by a few
+        # workers (started on first use), so a burst of expiring sessions can't
+        # occupy every default-executor thread with rmtree
+        self._profile_cleanup_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1000)
+        self._profile_cleanup_workers: list[asyncio.Task] = []
+        self._profile_cleanup_concurrency = 4
+
+        # Persistent cmd.exe that runs profile-cleanup BAT scripts from its stdin
+        # (Windows only) - spawned on first use, respawned if it exits
+        self._win_helper: asyncio.subprocess.Process | None = None
+        self._win_helper_spawn: asyncio.Task | None = None
+        self._win_helper_pending: list[bytes] = []
+
+        # Per-session idle bookkeeping, dropped when a session terminates
+        self._idle_tracking: dict[str, object] = {}
+        self._idle_check_count: dict[str, int] = {}
+
+        # Pending portproxy removals (Windows), drained by one netsh worker task
+        self._netsh_queue: asyncio.Queue[int] = asyncio.Queue()
+        self._netsh_worker_task: asyncio.Task | None = None
 
         self._background_tasks: set[asyncio.Task] = set()
         self._cleanup_running = False
         self._http: Optional[aiohttp.ClientSession] = None
         self._worker_to_port: dict[str, int] = {}
 
-        # Port state machine: {port: (state, worker_id, timestamp)}
-        # States: "FREE" | "RESERVED" | "ACTIVE"
-        self._port_state: dict[int, tuple[str, str, float]] = {}
+        # Port state machine: "FREE" | "RESERVED" | "ACTIVE"
+        # Kept as separate sets so state checks and counts are O(1);
+        # a port in neither set is FREE
+        self._reserved: set[int] = set()
+        self._active: set[int] = set()
+        self._reserved_ts: dict[int, float] = {}  # When each RESERVED port was claimed
+        self._port_owner: dict[int, str] = {}  # Worker owning a RESERVED/ACTIVE port
         self._reservation_timeout = 90.0  # Seconds before RESERVED state expires
 
+        # Untracked ports available for reservation (O(1) pick instead of range scan)
+        self._free_ports: set[int] = set(
+            range(settings.chrome_port_start, settings.chrome_port_end + 1)
+        )
+        # Ports that failed the socket probe: {port: timestamp}
+        # Returned to the free set once the probation timeout passes
+        self._probation_ports: dict[int, float] = {}
+        self._probation_timeout = 30.0
+        self._probe_window = 16  # Ports probed concurrently after a busy candidate
+        self._probing_ports: set[int] = set()  # Candidates currently being probed
+
     async def _get_machine_ip(self) -> str:
-        """Get machine's local IP address"""
+        """Get machine's local IP address (resolved once, then cached)"""
+        if self._cached_machine_ip:
+            return self._cached_machine_ip
+
         try:
             loop = asyncio.get_event_loop()
-            hostname = await asyncio.to_thread(socket.gethostname)
+            hostname = socket.gethostname()
 
             try:
-                ip_address = await asyncio.wait_for(
-                    loop.run_in_executor(None, socket.gethostbyname, hostname),
-                    timeout=2.0,
-                )
-            except asyncio.TimeoutError:
-                ip_address = "127.0.0.1"
+                # Numeric hostname resolves without touching DNS
+                ip_address = socket.getaddrinfo(
+                    hostname,
+                    None,
+                    socket.AF_INET,
+                    socket.SOCK_DGRAM,
+                    0,
+                    socket.AI_NUMERICHOST,
+                )[0][4][0]
+            except socket.gaierror:
+                try:
+                    infos = await asyncio.wait_for(
+                        loop.getaddrinfo(
+                            hostname,
+                            None,
+                            family=socket.AF_INET,
+                            flags=socket.AI_ADDRCONFIG,
+                        ),
+                        timeout=2.0,
+                    )
+                    ip_address = infos[0][4][0]
+                except (asyncio.TimeoutError, socket.gaierror, IndexError):
+                    ip_address = "127.0.0.1"
 
             if ip_address.startswith("127."):
                 try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    sock.setblocking(False)
-                    await asyncio.wait_for(
-                        loop.sock_connect(sock, ("8.8.8.8", 80)), timeout=2.0
-                    )
-                    ip_address = sock.getsockname()[0]
-                    sock.close()
+                    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                        sock.setblocking(False)
+                        await asyncio.wait_for(
+                            loop.sock_connect(sock, ("8.8.8.8", 80)), timeout=2.0
+                        )
+                        ip_address = sock.getsockname()[0]
                 except (asyncio.TimeoutError, OSError):
                     ip_address = "127.0.0.1"
 
+            # Loopback means detection failed - don't pin it, retry next call
+            if not ip_address.startswith("127."):
+                self._cached_machine_ip = ip_address
             return ip_address
         except Exception as e:
             logger.error(f"Failed to get machine IP: {e}")
             return "127.0.0.1"
 
     async def _get_public_ip_async(self) -> str:
-        """Get public IP for AWS VMs"""
+        """Get public IP for AWS VMs (IMDSv2 token and result are cached)"""
+        now = time.monotonic()
+        if self._cached_public_ip and now < self._public_ip_expiry:
+            return self._cached_public_ip
+
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=3)
-            ) as session:
+            session = await self._get_http()
+            timeout = aiohttp.ClientTimeout(total=3)
+
+            # Refresh token 5 minutes before it expires
+            if self._imds_token is None or now >= self._imds_token_expiry - 300:
                 async with session.put(
                     "http://169.254.169.254/latest/api/token",
                     headers={"X-aws-ec2-metadata-token-ttl-seconds": "21600"},
+                    timeout=timeout,
                 ) as token_response:  # type: aiohttp.ClientResponse
-                    if token_response.status == 200:
-                        token = await token_response.text()
-                        async with session.get(
-                            "http://169.254.169.254/latest/meta-data/public-ipv4",
-                            headers={"X-aws-ec2-metadata-token": token},
-                        ) as ip_response:  # type: aiohttp.ClientResponse
-                            if ip_response.status == 200:
-                                public_ip = (await ip_response.text()).strip()
-                                if public_ip:
-                                    return public_ip
+                    if token_response.status != 200:
+                        return await self._get_machine_ip()
+                    self._imds_token = await token_response.text()
+                    self._imds_token_expiry = now + 21600
+
+            async with session.get(
+                "http://169.254.169.254/latest/meta-data/public-ipv4",
+                headers={"X-aws-ec2-metadata-token": self._imds_token},
+                timeout=timeout,
+            ) as ip_response:  # type: aiohttp.ClientResponse
+                if ip_response.status == 200:
+                    public_ip = (await ip_response.text()).strip()
+                    if public_ip:
+                        self._cached_public_ip = public_ip
+                        self._public_ip_expiry = time.monotonic() + 300
+                        return public_ip
+                elif ip_response.status == 401:
+                    # Token rejected - fetch a fresh one next time
+                    self._imds_token = None
             return await self._get_machine_ip()
         except Exception:
             return await self._get_machine_ip()
@@ -179,186 +633,107 @@ class BrowserLauncher:
             return False
 
     async def _is_aws_vm(self) -> bool:
-        return await asyncio.to_thread(self._is_aws_vm_sync)
+        """Check if running on AWS VM (probed once, then cached for process lifetime)"""
+        if self._is_aws_vm_cached is None:
+            self._is_aws_vm_cached = await asyncio.get_running_loop().run_in_executor(
+                None, self._is_aws_vm_sync
+            )
+        return self._is_aws_vm_cached
 
     async def _get_http(self) -> aiohttp.ClientSession:
-        """Return a shared aiohttp session. Lazily create if needed."""
+        """
+        Return the shared aiohttp session, lazily creating it if needed.
+        All HTTP from the launcher (CDP checks, IMDS, API callbacks) goes
+        through this pool - don't open ad-hoc ClientSessions per call.
+        Closed in shutdown().
+        """
         if self._http is None or self._http.closed:
-            self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=1.0))
+            self._http = aiohttp.ClientSession(
+                # Room for a full cleanup fan-out of CDP checks plus callbacks,
+                # without one host (e.g. the callback API) taking every slot
+                connector=aiohttp.TCPConnector(
+                    limit=64, limit_per_host=32, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=1.0, sock_connect=0.1),
+            )
         return self._http
 
-    async def _setup_port_forwarding_with_timeout(self, port: int):
+    def _run_in_windows_helper(self, bat_script: str, *args: str):
         """
-        DEPRECATED: Port forwarding is now handled by custom Chrome launcher script.
-
-        This function is kept for backwards compatibility but is no longer called.
-        The custom script (launch_chrome_port.cmd) already creates port forwarding.
+        Hand a BAT script call to the persistent helper cmd.exe (Windows only).
+        The helper only dispatches: each call is started in the background with
+        `start /b`, so scripts still run in parallel (e.g. the lock-release wait
+        in cleanup_profile.bat) while the caller pays a pipe write instead of
+        creating a process from the event loop.
         """
-        logger.warning(
-            f"_setup_port_forwarding_with_timeout called for port {port} - "
-            f"This is deprecated. Port forwarding should be handled by custom launcher script."
-        )
-        try:
-            await asyncio.wait_for(
-                self._setup_windows_port_forwarding(port), timeout=15.0
-            )
-        except asyncio.TimeoutError:
-            logger.warning(
-                f"Port forwarding timeout for {port}, browser may not be accessible remotely"
-            )
-        except Exception as e:
-            logger.error(
-                f"Port forwarding failed for {port}: {e}, browser only accessible on localhost"
-            )
+        call = subprocess.list2cmdline([bat_script, *args])
+        line = f'start "" /b cmd /c "call {call} <NUL >NUL 2>&1"\r\n'.encode()
+        helper = self._win_helper
+        if helper is not None and helper.returncode is None:
+            try:
+                helper.stdin.write(line)
+                return
+            except Exception as e:
+                # Helper exited between the returncode check and the write
+                logger.debug(f"Cleanup helper pipe closed, respawning: {e}")
+                self._win_helper = None
 
-    async def _setup_windows_port_forwarding(self, port: int):
-        """
-        DEPRECATED: Port forwarding is now handled by custom Chrome launcher script.
+        self._win_helper_pending.append(line)
+        if self._win_helper_spawn is None or self._win_helper_spawn.done():
+            self._win_helper_spawn = asyncio.create_task(self._spawn_windows_helper())
 
-        This function is kept for backwards compatibility but should not be called.
-        The custom script creates:
-          1. netsh portproxy: LISTEN_IP:PORT -> 127.0.0.1:PORT
-          2. Windows Firewall rule for the port
-        """
+    async def _spawn_windows_helper(self):
+        """Start the helper cmd.exe and flush calls queued while it was down"""
         try:
-            remove_cmd = [
-                "netsh",
-                "interface",
-                "portproxy",
-                "delete",
-                "v4tov4",
-                "listenaddress=0.0.0.0",
-                f"listenport={port}",
-            ]
-
-            remove_proc = await asyncio.create_subprocess_exec(
-                *remove_cmd,
+            helper = await asyncio.create_subprocess_exec(
+                "cmd.exe",
+                "/Q",
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
+                startupinfo=_WIN_STARTUPINFO,
+                creationflags=subprocess.CREATE_NO_WINDOW,
             )
-            try:
-                await asyncio.wait_for(remove_proc.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                logger.warning(f"Initial netsh delete timeout for port {port}, killing")
-                try:
-                    remove_proc.kill()
-                except Exception:
-                    pass
-
-            cmd = [
-                "netsh",
-                "interface",
-                "portproxy",
-                "add",
-                "v4tov4",
-                "listenaddress=0.0.0.0",
-                f"listenport={port}",
-                "connectaddress=127.0.0.1",
-                f"connectport={port}",
-            ]
-
-            result = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        except Exception as e:
+            logger.warning(
+                f"Failed to start cleanup helper - dropping "
+                f"{len(self._win_helper_pending)} queued cleanup(s): {e}"
             )
+            self._win_helper_pending.clear()
+            return
 
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    result.communicate(), timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                logger.warning(
-                    f"netsh add command timeout for port {port}, killing process"
-                )
-                try:
-                    result.kill()
-                    await result.wait()
-                except Exception:
-                    pass
-                raise
-
-            if result.returncode != 0:
-                error_msg = (
-                    stderr.decode().strip()
-                    if stderr
-                    else stdout.decode().strip()
-                    if stdout
-                    else "No error details"
-                )
-                logger.error(f"Failed to set up port forwarding: {error_msg}")
+        self._win_helper = helper
+        pending, self._win_helper_pending = self._win_helper_pending, []
+        for line in pending:
+            helper.stdin.write(line)
+        logger.debug(f"Started cleanup helper (PID {helper.pid})")
 
-                if "elevation" in error_msg.lower() or "admin" in error_msg.lower():
-                    logger.error(
-                        "WARNING: Port forwarding requires administrator privileges! "
-                        "Please run this service as Administrator or grant necessary permissions."
-                    )
-            else:
-                show_cmd = ["netsh", "interface", "portproxy", "show", "v4tov4"]
-                result = await asyncio.create_subprocess_exec(
-                    *show_cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                try:
-                    stdout, _ = await asyncio.wait_for(
-                        result.communicate(), timeout=5.0
-                    )
-                    if stdout and f"0.0.0.0:{port}" in stdout.decode():
-                        logger.info(
-                            f"Verified port forwarding is active for port {port}"
-                        )
-                except asyncio.TimeoutError:
-                    logger.warning(f"netsh show command timeout for port {port}")
-                    try:
-                        result.kill()
-                    except Exception:
-                        pass
+    async def _stop_windows_helper(self):
+        """Let the helper dispatch queued cleanups, then exit it"""
+        if self._win_helper_spawn is not None:
+            await asyncio.gather(self._win_helper_spawn, return_exceptions=True)
 
-        except Exception as e:
-            logger.error(f"Error setting up port forwarding: {e}")
+        helper = self._win_helper
+        if helper is None or helper.returncode is not None:
+            return
 
-    def _remove_windows_port_forwarding_bat(self, port: int):
         try:
-            script_dir = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
-            bat_script = os.path.join(script_dir, "scripts", "cleanup_port.bat")
-
-            if not os.path.exists(bat_script):
-                logger.warning(f"cleanup_port.bat not found at {bat_script}")
-                return
-
-            subprocess.Popen(
-                [bat_script, str(port)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW
-                if hasattr(subprocess, "CREATE_NO_WINDOW")
-                else 0,
-            )
-            logger.debug(f"Started background port cleanup for {port}")
-
-        except Exception as e:
-            logger.warning(f"Failed to start port cleanup script for port {port}: {e}")
+            helper.stdin.write(b"exit\r\n")
+            await asyncio.wait_for(helper.wait(), timeout=30.0)
+        except asyncio.TimeoutError:
+            logger.warning("Cleanup helper still busy at shutdown - killing it")
+            helper.kill()
+        except Exception:
+            pass
 
     def _cleanup_profile_directory_bat(self, profile_dir: str):
         try:
-            script_dir = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
-            bat_script = os.path.join(script_dir, "scripts", "cleanup_profile.bat")
-
-            if not os.path.exists(bat_script):
-                logger.warning(f"cleanup_profile.bat not found at {bat_script}")
+            bat_script = _BAT_SCRIPTS["cleanup_profile.bat"]
+            if bat_script is None:
+                logger.warning(f"cleanup_profile.bat not found in {_SCRIPTS_DIR}")
                 return
 
-            subprocess.Popen(
-                [bat_script, profile_dir],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW
-                if hasattr(subprocess, "CREATE_NO_WINDOW")
-                else 0,
-            )
+            self._run_in_windows_helper(bat_script, profile_dir)
             logger.debug(
                 f"Started background profile cleanup for {os.path.basename(profile_dir)}"
             )
@@ -376,19 +751,14 @@ class BrowserLauncher:
         Kills process, removes port forwarding, and optionally deletes profile.
         """
         try:
-            system = platform.system().lower()
-            if system != "windows":
+            if not _IS_WINDOWS:
                 return False
 
-            script_dir = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
-            bat_script = os.path.join(
-                script_dir, "scripts", "cleanup_expired_session.bat"
-            )
-
-            if not os.path.exists(bat_script):
-                logger.warning(f"cleanup_expired_session.bat not found at {bat_script}")
+            bat_script = _BAT_SCRIPTS["cleanup_expired_session.bat"]
+            if bat_script is None:
+                logger.warning(
+                    f"cleanup_expired_session.bat not found in {_SCRIPTS_DIR}"
+                )
                 return False
 
             args = [bat_script, str(pid), str(port)]
@@ -412,10 +782,41 @@ class BrowserLauncher:
             logger.warning(f"Failed to start session cleanup script: {e}")
             return False
 
+    def _queue_port_forwarding_removal(self, port: int):
+        """
+        Queue removal of the 0.0.0.0 portproxy mapping for a port (fire-and-forget).
+        A single worker drains the queue and runs the netsh deletes for everything
+        pending in parallel, so burst teardowns never spawn from the event loop.
+        No-op with the custom launcher: it maps LISTEN_IP (not 0.0.0.0) and
+        clears stale mappings for the port itself before every launch.
+        """
+        if settings.use_custom_chrome_launcher:
+            return
+
+        self._netsh_queue.put_nowait(port)
+        if self._netsh_worker_task is None or self._netsh_worker_task.done():
+            self._netsh_worker_task = asyncio.create_task(self._netsh_worker())
+
+    async def _netsh_worker(self):
+        """Remove queued portproxy mappings, one parallel batch per drain"""
+        queue = self._netsh_queue
+        while True:
+            ports = [await queue.get()]
+            while not queue.empty():
+                ports.append(queue.get_nowait())
+            try:
+                await asyncio.gather(
+                    *(self._remove_windows_port_forwarding(p) for p in set(ports)),
+                    return_exceptions=True,
+                )
+            finally:
+                for _ in ports:
+                    queue.task_done()
+
     async def _remove_windows_port_forwarding(self, port: int):
-        proc = None
+        """Run one netsh portproxy delete, killing it if it hangs"""
         try:
-            cmd = [
+            proc = await asyncio.create_subprocess_exec(
                 "netsh",
                 "interface",
                 "portproxy",
@@ -423,42 +824,34 @@ class BrowserLauncher:
                 "v4tov4",
                 "listenaddress=0.0.0.0",
                 f"listenport={port}",
-            ]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
                 stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.DEVNULL,
+                startupinfo=_WIN_STARTUPINFO,
             )
+        except Exception as e:
+            logger.warning(f"Error removing port forwarding for {port}: {e}")
+            return
 
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=1.5)
+            logger.debug(f"Removed portproxy mapping for port {port}")
+        except asyncio.TimeoutError:
             try:
-                await asyncio.wait_for(proc.communicate(), timeout=1.5)
-                logger.debug(f"Removed portproxy mapping for port {port}")
+                proc.kill()
+                await asyncio.wait_for(proc.wait(), timeout=1.0)
             except asyncio.TimeoutError:
-                try:
-                    proc.kill()
-                    await asyncio.wait_for(proc.wait(), timeout=1.0)
-                except asyncio.TimeoutError:
-                    logger.warning(
-                        f"netsh process for port {port} won't die - abandoning"
-                    )
-                except Exception:
-                    pass
-
-        except asyncio.TimeoutError:
-            logger.warning(f"netsh timeout for port {port}")
-            if proc:
-                try:
-                    proc.kill()
-                except Exception:
-                    pass
+                logger.warning(f"netsh process for port {port} won't die - abandoning")
+            except Exception:
+                pass
         except Exception as e:
             logger.warning(f"Error removing port forwarding for {port}: {e}")
-            if proc:
-                try:
-                    proc.kill()
-                except Exception:
-                    pass
+
+    def _clear_port_state(self, port: int) -> str | None:
+        """Move a port back to FREE in the state machine. Returns its previous owner."""
+        self._reserved.discard(port)
+        self._active.discard(port)
+        self._reserved_ts.pop(port, None)
+        return self._port_owner.pop(port, None)
 
     async def _release_port(self, port: int):
         """
@@ -470,71 +863,144 @@ class BrowserLauncher:
             return
 
         async with self._port_lock:
-            # Clear legacy used_ports set (for backward compatibility)
-            self._used_ports.discard(port)
-
-            # Clear port state machine
-            self._port_state.pop(port, None)
-
-            # Clear any worker mappings pointing to this port
-            for wid, p in list(self._worker_to_port.items()):
-                if p == port:
-                    self._worker_to_port.pop(wid, None)
-
-            logger.debug(
-                f"Port {port} released from all tracking | "
-                f"Active ports: {len([s for s, (st, _, _) in self._port_state.items() if st == 'ACTIVE'])}"
-            )
+            # Clear port state machine and return port to the free pool
+            owner = self._clear_port_state(port)
+            self._probation_ports.pop(port, None)
+            # A released port's listener PID is stale once the session is gone
+            self._pid_port_cache.pop(port, None)
+            if settings.chrome_port_start <= port <= settings.chrome_port_end:
+                self._free_ports.add(port)
+
+            # Clear the owning worker's mapping (port -> owner is already tracked)
+            if owner is not None and self._worker_to_port.get(owner) == port:
+                del self._worker_to_port[owner]
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Port %d released from all tracking | Active ports: %d",
+                    port,
+                    len(self._active),
+                )
 
     async def _reserve_port_for_worker(self, worker_id: str) -> int:
         """
-        Atomically reserve a port for a worker under lock.
+        Atomically reserve a port for a worker.
         Returns port number or raises RuntimeError if no ports available.
 
+        Candidates are taken out of the free pool under lock, then socket-probed
+        in threads with the lock released so other workers and the event loop
+        are never blocked by probe timeouts. The first round probes a single
+        port; if it turns out to be busy (e.g. cold start on a host with ports
+        taken by other programs), later rounds probe a window of ports
+        concurrently.
+
         Port moves from FREE → RESERVED state.
         """
-        async with self._port_lock:
-            now = time.time()
+        window = 1
+        while True:
+            async with self._port_lock:
+                now = time.time()
+
+                # Expire stale RESERVED states (>90s old)
+                # Collected first, cleared after the loop - no copy of the dict needed
+                stale_ports = []
+                for p, ts in self._reserved_ts.items():
+                    if now - ts > self._reservation_timeout:
+                        logger.warning(
+                            f"Port {p} RESERVED by {self._port_owner.get(p, '')[:8]} "
+                            f"expired after {now - ts:.1f}s"
+                        )
+                        stale_ports.append(p)
+
+                for p in stale_ports:
+                    # _release_port won't see an owner once it is dropped here,
+                    # so clear the worker's mapping now
+                    owner = self._clear_port_state(p)
+                    if owner is not None and self._worker_to_port.get(owner) == p:
+                        del self._worker_to_port[owner]
+                    self._free_ports.add(p)
+
+                # Give ports that failed an earlier probe another chance
+                expired_probation = [
+                    p
+                    for p, ts in self._probation_ports.items()
+                    if now - ts > self._probation_timeout
+                ]
+                for p in expired_probation:
+                    del self._probation_ports[p]
+                    self._free_ports.add(p)
 
-            # Expire stale RESERVED states (>90s old)
-            stale_ports = []
-            for p, (st, wid, ts) in list(self._port_state.items()):
-                if st == "RESERVED" and now - ts > self._reservation_timeout:
-                    logger.warning(
-                        f"Port {p} RESERVED by {wid[:8]} expired after {now - ts:.1f}s"
+                if not self._free_ports and not self._probing_ports:
+                    raise RuntimeError(
+                        f"No free ports found between {settings.chrome_port_start} and {settings.chrome_port_end}. "
+                        f"All ports in use or reserved."
                     )
-                    stale_ports.append(p)
 
-            for p in stale_ports:
-                self._port_state.pop(p, None)
+                # Take candidates out of the free pool while probing
+                candidates = [
+                    self._free_ports.pop()
+                    for _ in range(min(window, len(self._free_ports)))
+                ]
+                self._probing_ports.update(candidates)
+
+            if not candidates:
+                # Other workers are probing the remaining ports - wait for their results
+                await asyncio.sleep(0.05)
+                continue
 
-            # Find a free port
-            all_ports = list(
-                range(settings.chrome_port_start, settings.chrome_port_end + 1)
-            )
-            random.shuffle(all_ports)
-
-            for port in all_ports:
-                st = self._port_state.get(port)
-                # Port is candidate if not tracked or explicitly FREE
-                if st is None or st[0] == "FREE":
-                    # Verify port is actually free (socket probe)
-                    if self._check_port_free(port):
-                        # Atomically reserve it
-                        self._port_state[port] = ("RESERVED", worker_id, now)
+            # Verify candidates are actually free (socket probe) without holding the lock
+            # Probes are context-free, so skip to_thread's contextvars copy
+            loop = asyncio.get_running_loop()
+            try:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(None, self._check_port_free, p)
+                        for p in candidates
+                    )
+                )
+            except BaseException:
+                async with self._port_lock:
+                    self._probing_ports.difference_update(candidates)
+                    self._free_ports.update(
+                        p for p in candidates if p not in self._port_owner
+                    )
+                raise
+
+            async with self._port_lock:
+                self._probing_ports.difference_update(candidates)
+                reserved = None
+                now = time.time()
+                for port, is_free in zip(candidates, results):
+                    if port in self._port_owner:
+                        # Claimed through another path while probing
+                        continue
+                    if not is_free:
+                        # Occupied outside our tracking - park it instead of retrying now
+                        self._free_ports.discard(port)
+                        self._probation_ports[port] = now
+                    elif reserved is None:
+                        self._free_ports.discard(port)
+                        self._reserved.add(port)
+                        self._reserved_ts[port] = now
+                        self._port_owner[port] = worker_id
                         self._worker_to_port[worker_id] = port
+                        reserved = port
+                    else:
+                        # Free but not needed - return to the pool
+                        self._free_ports.add(port)
+
+                if reserved is not None:
+                    if logger.isEnabledFor(logging.DEBUG):
                         logger.debug(
-                            f"Port {port} RESERVED for worker {worker_id[:8]} | "
-                            f"Reserved: {len([s for s, (st, _, _) in self._port_state.items() if st == 'RESERVED'])}, "
-                            f"Active: {len([s for s, (st, _, _) in self._port_state.items() if st == 'ACTIVE'])}"
+                            "Port %d RESERVED for worker %s | Reserved: %d, Active: %d",
+                            reserved,
+                            worker_id[:8],
+                            len(self._reserved),
+                            len(self._active),
                         )
-                        return port
+                    return reserved
 
-            # No free ports found
-            raise RuntimeError(
-                f"No free ports found between {settings.chrome_port_start} and {settings.chrome_port_end}. "
-                f"All ports in use or reserved."
-            )
+            window = self._probe_window
 
     async def _activate_reserved_port(self, worker_id: str, port: int):
         """
@@ -544,20 +1010,32 @@ class BrowserLauncher:
         Port moves from RESERVED → ACTIVE state.
         """
         async with self._port_lock:
-            st = self._port_state.get(port)
-            if st and st[0] == "RESERVED" and st[1] == worker_id:
-                self._port_state[port] = ("ACTIVE", worker_id, time.time())
-                logger.debug(
-                    f"Port {port} ACTIVATED for worker {worker_id[:8]} | "
-                    f"Active: {len([s for s, (st, _, _) in self._port_state.items() if st == 'ACTIVE'])}"
-                )
-            elif st and st[0] == "ACTIVE" and st[1] == worker_id:
+            owner = self._port_owner.get(port)
+            if port in self._reserved and owner == worker_id:
+                self._reserved.discard(port)
+                self._reserved_ts.pop(port, None)
+                self._active.add(port)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Port %d ACTIVATED for worker %s | Active: %d",
+                        port,
+                        worker_id[:8],
+                        len(self._active),
+                    )
+            elif port in self._active and owner == worker_id:
                 # Idempotent - already active by same worker
                 return
             else:
+                state = (
+                    "RESERVED"
+                    if port in self._reserved
+                    else "ACTIVE"
+                    if port in self._active
+                    else "FREE"
+                )
                 logger.warning(
                     f"Cannot activate port {port} for worker {worker_id[:8]} - "
-                    f"current state: {st}"
+                    f"current state: {state} (owner: {owner})"
                 )
 
     async def _rollback_reserved_port(self, worker_id: str, port: int):
@@ -568,13 +1046,17 @@ class BrowserLauncher:
         Port moves from RESERVED → FREE (removed from tracking).
         """
         async with self._port_lock:
-            st = self._port_state.get(port)
-            if st and st[0] == "RESERVED" and st[1] == worker_id:
-                self._port_state.pop(port, None)
+            if port in self._reserved and self._port_owner.get(port) == worker_id:
+                self._clear_port_state(port)
                 self._worker_to_port.pop(worker_id, None)
-                logger.debug(
-                    f"Port {port} reservation ROLLED BACK for worker {worker_id[:8]}"
-                )
+                self._free_ports.add(port)
+                self._pid_port_cache.pop(port, None)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Port %d reservation ROLLED BACK for worker %s",
+                        port,
+                        worker_id[:8],
+                    )
             else:
                 # Already cleaned up or wrong worker - that's okay
                 self._worker_to_port.pop(worker_id, None)
@@ -592,89 +1074,16 @@ class BrowserLauncher:
         Returns True if port is free, False if in use or on any exception.
         Treats all errors as "port in use" to err on the safe side.
         """
-        s = None
         try:
-            if settings.use_custom_chrome_launcher:
-                addr = "127.0.0.1"
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(0.1)  # 100ms timeout for localhost
-                return s.connect_ex((addr, port)) != 0
-            else:
-                addr = "0.0.0.0"
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.settimeout(0.1)  # 100ms timeout for localhost
-                s.bind((addr, port))
+                if settings.use_custom_chrome_launcher:
+                    return s.connect_ex(("127.0.0.1", port)) != 0
+                s.bind(("0.0.0.0", port))
                 return True
         except Exception:
             # Treat all exceptions as "port in use" (safe default)
             return False
-        finally:
-            if s:
-                try:
-                    s.close()
-                except Exception:
-                    pass
-
-    async def _find_free_port(
-        self, start_port: int = None, max_port: int = None
-    ) -> int:
-        """
-        DEPRECATED: Use _reserve_port_for_worker() instead.
-
-        Find a random free port for Chrome debugging.
-        This method uses legacy _used_ports tracking and is no longer used.
-        """
-        if start_port is None:
-            start_port = settings.chrome_port_start
-        if max_port is None:
-            max_port = settings.chrome_port_end + 1
-
-        logger.info(f"Searching for free port between {start_port} and {max_port}")
-
-        all_ports = list(range(start_port, max_port))
-        random.shuffle(all_ports)
-
-        async with self._port_lock:
-            used_ports_snapshot = self._used_ports.copy()
-            logger.info(
-                f"Total ports to check: {len(all_ports)}, Used ports: {sorted(used_ports_snapshot)}"
-            )
-
-        candidate_ports = [p for p in all_ports if p not in used_ports_snapshot]
-
-        checked_count = 0
-        for port in candidate_ports:
-            checked_count += 1
-            try:
-                is_free = await asyncio.to_thread(self._check_port_free, port)
-
-                if is_free:
-                    async with self._port_lock:
-                        if port not in self._used_ports:
-                            self._used_ports.add(port)
-                            logger.info(
-                                f"Found free port: {port} (checked {checked_count} ports)"
-                            )
-                            return port
-                        else:
-                            logger.debug(
-                                f"Port {port} was taken by another request, continuing"
-                            )
-                            continue
-
-            except Exception as e:
-                logger.warning(f"Error checking port {port}: {e}")
-                continue
-
-        logger.error(
-            f"No free ports found between {start_port} and {max_port}. "
-            f"Checked {checked_count} ports. "
-            f"Currently used ports: {sorted(used_ports_snapshot)}"
-        )
-        raise RuntimeError(
-            f"No free ports found between {start_port} and {max_port}. "
-            f"Used: {len(used_ports_snapshot)} ports"
-        )
 
     async def _send_callback_to_api(self, response: BrowserSessionResponse) -> bool:
         """Send browser launch response to API"""
@@ -686,21 +1095,81 @@ class BrowserLauncher:
 
         try:
             response_dict = response.model_dump(mode="json")
-            success, status_code, response_text = await send_post_request(
-                url=settings.browser_api_callback_url, data=response_dict, timeout=30
-            )
-
-            if success:
-                logger.info("Response sent successfully")
-                return True
-            else:
-                logger.warning(f"API callback failed: {status_code}")
-                return False
+            # Successful launches always go out immediately; rejections and
+            # failures arriving in a burst can share one POST when batching is on
+            if (
+                settings.browser_api_callback_batch_ms > 0
+                and response.status != RequestStatus.COMPLETED
+            ):
+                return await self._enqueue_callback(response_dict)
+            return await self._post_callback(response_dict)
 
         except Exception as e:
             logger.error(f"API callback error: {e}")
             return False
 
+    async def _post_callback(self, payload: Union[dict, list]) -> bool:
+        """POST one callback object (or a batched array) to the API"""
+        success, status_code, response_text = await send_post_request(
+            url=settings.browser_api_callback_url,
+            data=payload,
+            timeout=30,
+            session=await self._get_http(),
+        )
+
+        if success:
+            logger.info("Response sent successfully")
+            return True
+        else:
+            logger.warning(f"API callback failed: {status_code}")
+            return False
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a fire-and-forget task; it drops out of _background_tasks once done"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _enqueue_callback(self, payload: dict) -> bool:
+        """Queue a callback for the current batch window and wait for its POST result"""
+        result = asyncio.get_running_loop().create_future()
+        self._callback_queue.append((payload, result))
+
+        if self._callback_flush_task is None:
+            self._callback_flush_task = self._spawn(self._flush_callbacks())
+
+        return await result
+
+    async def _flush_callbacks(self):
+        """Send every callback queued during the batch window in a single POST"""
+        batch: list[tuple[dict, asyncio.Future]] = []
+        ok = False
+        try:
+            await asyncio.sleep(settings.browser_api_callback_batch_ms / 1000)
+
+            # Later arrivals start a new window
+            batch, self._callback_queue = self._callback_queue, []
+            self._callback_flush_task = None
+
+            payloads = [payload for payload, _ in batch]
+            # A lone callback keeps the single-object shape
+            ok = await self._post_callback(
+                payloads[0] if len(payloads) == 1 else payloads
+            )
+            if len(payloads) > 1:
+                logger.debug(f"Sent {len(payloads)} batched callbacks in one request")
+        except Exception as e:
+            logger.error(f"API callback error: {e}")
+        finally:
+            if self._callback_flush_task is asyncio.current_task():
+                # Cancelled during the window - release everything still queued
+                batch, self._callback_queue = self._callback_queue, []
+                self._callback_flush_task = None
+            for _, result in batch:
+                if not result.done():
+                    result.set_result(ok)
+
     def has_available_slots(self) -> bool:
         """Check if there are available slots for new browser sessions"""
         return len(self.sessions) < settings.max_browser_instances
@@ -718,20 +1187,15 @@ class BrowserLauncher:
             True if at least one port is available in the range
         """
         total_ports = (settings.chrome_port_end - settings.chrome_port_start) + 1
-        # Count ports in RESERVED or ACTIVE state (new state machine tracking)
-        occupied_ports = len(
-            [
-                p
-                for p, (st, _, _) in self._port_state.items()
-                if st in ("RESERVED", "ACTIVE")
-            ]
-        )
+        # Ports in RESERVED or ACTIVE state (set sizes, no dict scan)
+        occupied_ports = len(self._reserved) + len(self._active)
         return occupied_ports < total_ports
 
     async def launch_browser_session(
         self, request: BrowserSessionRequest
     ) -> BrowserSessionResponse:
-        worker_id = str(uuid.uuid4())
+        # Opaque random token - skips building and formatting a UUID object
+        worker_id = secrets.token_hex(16)
 
         machine_ip = self._cached_machine_ip or "127.0.0.1"
         public_ip = self._cached_public_ip or "127.0.0.1"
@@ -739,68 +1203,46 @@ class BrowserLauncher:
         if not self._cached_machine_ip or not self._cached_public_ip:
             logger.error("IP cache not initialized! This should never happen.")
 
+        # Port exhaustion and slot availability are checked under a single lock.
+        # The counters are only mutated synchronously, so one acquisition gives
+        # a coherent view of both.
         total_ports = (settings.chrome_port_end - settings.chrome_port_start) + 1
-        async with self._port_lock:
-            # Count ports in RESERVED or ACTIVE state (new state machine tracking)
-            occupied_ports = len(
-                [
-                    p
-                    for p, (st, _, _) in self._port_state.items()
-                    if st in ("RESERVED", "ACTIVE")
-                ]
-            )
+        rejection_msg = None
+        async with self._session_lock:
+            # Ports in RESERVED or ACTIVE state (set sizes, no dict scan)
+            occupied_ports = len(self._reserved) + len(self._active)
             if occupied_ports >= total_ports:
-                reserved_count = len(
-                    [
-                        p
-                        for p, (st, _, _) in self._port_state.items()
-                        if st == "RESERVED"
-                    ]
-                )
-                active_count = len(
-                    [p for p, (st, _, _) in self._port_state.items() if st == "ACTIVE"]
-                )
-                msg = (
+                rejection_msg = (
                     f"No free debug ports in range "
                     f"{settings.chrome_port_start}-{settings.chrome_port_end}. "
                     f"All {total_ports} ports exhausted "
-                    f"(Reserved: {reserved_count}, Active: {active_count})."
-                )
-                logger.warning(msg)
-                resp = BrowserSessionResponse(
-                    status=RequestStatus.SLOT_FULL,
-                    worker_id=worker_id,
-                    machine_ip=public_ip,
-                    debug_port=0,
-                    requester_id=request.requester_id,
-                    session_id=request.session_id,
-                    error_message=msg,
+                    f"(Reserved: {len(self._reserved)}, Active: {len(self._active)})."
                 )
-                if settings.browser_api_callback_enabled:
-                    await self._send_callback_to_api(resp)
-                return resp
-
-        async with self._session_lock:
-            if not self.has_available_slots():
+                logger.warning(rejection_msg)
+            elif not self.has_available_slots():
                 logger.warning(
                     f"[WARN] NO SLOTS AVAILABLE | Request rejected: {request.id} | "
                     f"Active browsers: {len(self.sessions)}/{settings.max_browser_instances} | "
                     f"Ports in use: {[s.debug_port for s in self.sessions.values()]}"
                 )
-                slot_full_response = BrowserSessionResponse(
-                    status=RequestStatus.SLOT_FULL,
-                    worker_id=worker_id,
-                    machine_ip=public_ip,
-                    debug_port=0,
-                    requester_id=request.requester_id,
-                    session_id=request.session_id,
-                    error_message=f"No available slots on this launcher. Currently {len(self.sessions)}/{settings.max_browser_instances} slots are occupied. Please retry in a few minutes when a session becomes available. The request has been returned to the queue for processing by another available launcher.",
-                )
+                rejection_msg = f"No available slots on this launcher. Currently {len(self.sessions)}/{settings.max_browser_instances} slots are occupied. Please retry in a few minutes when a session becomes available. The request has been returned to the queue for processing by another available launcher."
+
+        if rejection_msg:
+            slot_full_response = BrowserSessionResponse(
+                status=RequestStatus.SLOT_FULL,
+                worker_id=worker_id,
+                machine_ip=public_ip,
+                debug_port=0,
+                requester_id=request.requester_id,
+                session_id=request.session_id,
+                error_message=rejection_msg,
+            )
 
-                if settings.browser_api_callback_enabled:
-                    await self._send_callback_to_api(slot_full_response)
+            # Send callback outside the lock so a slow API doesn't stall other launches
+            if settings.browser_api_callback_enabled:
+                await self._send_callback_to_api(slot_full_response)
 
-                return slot_full_response
+            return slot_full_response
 
         debug_port = None
         process = None
@@ -814,52 +1256,20 @@ class BrowserLauncher:
 
             user_data_dir = request.user_data_dir
             if not user_data_dir:
-                system = platform.system().lower()
-                if system == "windows" and settings.use_custom_chrome_launcher:
-                    launcher_path = settings.chrome_launcher_cmd
-                    basedir = os.path.dirname(launcher_path)
-                    if not basedir or basedir == ".":
-                        basedir = r"C:\Chrome-RDP"
-                    user_data_dir = os.path.join(basedir, f"p{debug_port}")
-                    await asyncio.to_thread(os.makedirs, basedir, exist_ok=True)
-                else:
-                    user_data_dir = os.path.join(
-                        tempfile.gettempdir(), f"chrome_profile_p{debug_port}"
-                    )
-                await asyncio.to_thread(os.makedirs, user_data_dir, exist_ok=True)
+                user_data_dir = await asyncio.to_thread(
+                    _prepare_default_user_data_dir, debug_port
+                )
             else:
                 try:
                     user_data_dir = await asyncio.to_thread(
                         lambda p: os.path.abspath(os.path.realpath(p)), user_data_dir
                     )
 
-                    allowed_bases = [
-                        tempfile.gettempdir(),
-                        "/tmp",
-                        "/var/tmp",
-                        os.path.expanduser("~/chrome_profiles"),
-                    ]
-
-                    if settings.use_custom_chrome_launcher:
-                        launcher_path = settings.chrome_launcher_cmd
-                        custom_basedir = os.path.dirname(launcher_path)
-                        if custom_basedir and custom_basedir != ".":
-                            allowed_bases.append(custom_basedir)
-
-                    is_allowed = False
-                    for base in allowed_bases:
-                        try:
-                            base_real = await asyncio.to_thread(
-                                lambda b: os.path.abspath(os.path.realpath(b)), base
-                            )
-                            if (
-                                user_data_dir.startswith(base_real + os.sep)
-                                or user_data_dir == base_real
-                            ):
-                                is_allowed = True
-                                break
-                        except Exception:
-                            continue
+                    allowed_bases = await self._get_allowed_bases()
+                    # One C-level startswith over precomputed "base/" prefixes
+                    is_allowed = user_data_dir in allowed_bases or (
+                        user_data_dir.startswith(self._allowed_base_prefixes)
+                    )
 
                     if not is_allowed:
                         raise ValueError(
@@ -867,16 +1277,13 @@ class BrowserLauncher:
                         )
 
                     dir_name = os.path.basename(user_data_dir)
-                    if not all(c.isalnum() or c in "-_" for c in dir_name):
+                    if not _DIR_NAME_RE.match(dir_name):
                         raise ValueError(f"Invalid directory name: {dir_name}")
 
                 except Exception as e:
                     raise ValueError(f"Invalid user_data_dir path: {e}")
 
-            if (
-                settings.use_custom_chrome_launcher
-                and platform.system().lower() == "windows"
-            ):
+            if settings.use_custom_chrome_launcher and _IS_WINDOWS:
                 process = await self._launch_chrome_custom(
                     debug_port, machine_ip, user_data_dir
                 )
@@ -889,25 +1296,27 @@ class BrowserLauncher:
                     chrome_args=request.chrome_args,
                 )
 
-                process = subprocess.Popen(
-                    chrome_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                # Spawn through the event loop; the child watcher fills in
+                # returncode on exit, so poll() is a plain attribute read
+                process = LauncherProcess(
+                    await asyncio.create_subprocess_exec(
+                        *chrome_cmd,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL,
+                        # Own process group so termination is a single killpg
+                        # (ignored on Windows)
+                        start_new_session=True,
+                    )
                 )
 
             host_for_probe = "127.0.0.1"
             devtools_deadline = min(90.0, settings.browser_timeout / 1000)
 
-            poll_result = None
-            if isinstance(process, ChromeProcessWrapper):
-                poll_result = await process.poll()
-            else:
-                poll_result = process.poll()
-
-            if poll_result is not None:
-                raise RuntimeError(
-                    f"Chrome process exited immediately with code: {poll_result}"
-                )
-
-            if not await self._wait_devtools(
+            # No pre-check poll: a freshly spawned process has practically never
+            # exited yet. One poll after a failed wait tells "died" from "hung".
+            # The custom launcher already waited for DevTools before returning.
+            devtools_ready = getattr(process, "devtools_ready", False)
+            if not devtools_ready and not await self._wait_devtools(
                 host_for_probe, debug_port, devtools_deadline
             ):
                 if isinstance(process, ChromeProcessWrapper):
@@ -933,10 +1342,17 @@ class BrowserLauncher:
                 )
                 ttl_minutes = settings.hard_ttl_minutes
 
-            # Capture process create_time for PID-reuse validation
+            # Capture process identity for PID-reuse validation at termination
+            process_name = None
             try:
-                proc_for_create_time = psutil.Process(process.pid)
-                process_create_time = proc_for_create_time.create_time()
+                if isinstance(process, ChromeProcessWrapper):
+                    # psutil already read create_time when the Process was built
+                    proc_for_identity = process.chrome_process
+                else:
+                    proc_for_identity = psutil.Process(process.pid)
+                with proc_for_identity.oneshot():
+                    process_create_time = proc_for_identity.create_time()
+                    process_name = proc_for_identity.name().lower()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 process_create_time = None
                 logger.warning(f"Could not capture create_time for PID {process.pid}")
@@ -948,6 +1364,7 @@ class BrowserLauncher:
                 "debug_port": debug_port,
                 "process_id": process.pid,
                 "process_create_time": process_create_time,
+                "process_name": process_name,
                 "user_data_dir": user_data_dir,
                 "expires_at": datetime.now(UTC) + timedelta(minutes=ttl_minutes),
                 "websocket_url": f"ws://{public_ip}:{debug_port}/devtools/browser",
@@ -970,6 +1387,7 @@ class BrowserLauncher:
                         "Maximum browser instances reached during concurrent launch"
                     )
                 self.sessions[worker_id] = session
+                self._sessions_snapshot = tuple(self.sessions.values())
 
             # Promote port from RESERVED → ACTIVE after successful launch
             await self._activate_reserved_port(worker_id, debug_port)
@@ -1010,6 +1428,7 @@ class BrowserLauncher:
             async with self._session_lock:
                 if worker_id in self.sessions:
                     del self.sessions[worker_id]
+                    self._sessions_snapshot = tuple(self.sessions.values())
                     logger.debug(
                         f"Removed failed session {worker_id[:8]} from tracking"
                     )
@@ -1034,19 +1453,15 @@ class BrowserLauncher:
                 except Exception as proc_error:
                     logger.warning(f"Failed to terminate Chrome process: {proc_error}")
 
-            is_temp_profile = user_data_dir and (
-                "chrome_profile_" in user_data_dir or "Chrome-RDP" in user_data_dir
-            )
-
-            if is_temp_profile:
+            if user_data_dir and _TEMP_PROFILE_RE.search(user_data_dir):
                 try:
-                    if await asyncio.to_thread(os.path.exists, user_data_dir):
-                        await asyncio.to_thread(
-                            shutil.rmtree, user_data_dir, ignore_errors=True
-                        )
-                        logger.debug(
-                            f"Cleaned up failed launch profile: {os.path.basename(user_data_dir)}"
-                        )
+                    # ignore_errors covers a missing directory - no exists() probe needed
+                    await asyncio.to_thread(
+                        shutil.rmtree, user_data_dir, ignore_errors=True
+                    )
+                    logger.debug(
+                        f"Cleaned up failed launch profile: {os.path.basename(user_data_dir)}"
+                    )
                 except Exception as cleanup_error:
                     logger.warning(f"Failed to clean up directory: {cleanup_error}")
 
@@ -1060,6 +1475,46 @@ class BrowserLauncher:
                 error_message=str(e),
             )
 
+    async def _get_allowed_bases(self) -> list[str]:
+        """
+        Resolved base directories a caller-supplied user_data_dir may live under.
+        Realpaths are computed once and only recomputed if launcher settings change.
+        """
+        key = (settings.use_custom_chrome_launcher, settings.chrome_launcher_cmd)
+        if self._allowed_bases_key == key:
+            return self._allowed_bases_real
+
+        async with self._allowed_bases_lock:
+            if self._allowed_bases_key == key:
+                return self._allowed_bases_real
+
+            bases = [
+                tempfile.gettempdir(),
+                "/tmp",
+                "/var/tmp",
+                os.path.expanduser("~/chrome_profiles"),
+            ]
+            if settings.use_custom_chrome_launcher:
+                custom_basedir = os.path.dirname(settings.chrome_launcher_cmd)
+                if custom_basedir and custom_basedir != ".":
+                    bases.append(custom_basedir)
+
+            def _resolve(paths: list[str]) -> list[str]:
+                resolved = []
+                for b in paths:
+                    try:
+                        resolved.append(os.path.abspath(os.path.realpath(b)))
+                    except Exception:
+                        continue
+                return resolved
+
+            self._allowed_bases_real = await asyncio.to_thread(_resolve, bases)
+            self._allowed_base_prefixes = tuple(
+                b + os.sep for b in self._allowed_bases_real
+            )
+            self._allowed_bases_key = key
+            return self._allowed_bases_real
+
     async def _launch_chrome_custom(
         self, debug_port: int, machine_ip: str, user_data_dir: str
     ) -> Union[subprocess.Popen, ChromeProcessWrapper]:
@@ -1077,82 +1532,62 @@ class BrowserLauncher:
                 f"Chrome launcher not found: {settings.chrome_launcher_cmd}"
             )
 
-        startupinfo = None
-        if platform.system() == "Windows":
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-        full_cmd = [
+        # Stream the launcher's stdout through the event loop so the PID line
+        # is picked up as soon as it's written (no thread-pool read polling)
+        proc = await asyncio.create_subprocess_exec(
             "cmd.exe",
             "/c",
             settings.chrome_launcher_cmd,
             str(debug_port),
             machine_ip,
-        ]
-        process = subprocess.Popen(
-            full_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            startupinfo=startupinfo,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            startupinfo=_WIN_STARTUPINFO,
         )
+        process = LauncherProcess(proc)
 
         chrome_pid = None
         try:
-            loop = asyncio.get_event_loop()
-
-            def _read_chunk():
-                try:
-                    return os.read(process.stdout.fileno(), 128)
-                except Exception:
-                    return b""
-
-            buf = b""
-            for _ in range(8):
-                chunk = await asyncio.wait_for(
-                    loop.run_in_executor(None, _read_chunk), timeout=0.25
+            loop = asyncio.get_running_loop()
+            read_deadline = loop.time() + 2.0
+            while chrome_pid is None:
+                line = await asyncio.wait_for(
+                    proc.stdout.readline(), timeout=read_deadline - loop.time()
                 )
-                if not chunk:
-                    await asyncio.sleep(0.05)
-                    continue
-                buf += chunk
-                for token in buf.decode(errors="ignore").split():
-                    if token.isdigit():
+                if not line:
+                    break
+                for token in line.decode(errors="ignore").split():
+                    # Launcher prints 0 when it couldn't find the PID itself
+                    if token.isdigit() and int(token) > 0:
                         chrome_pid = int(token)
                         break
-                if chrome_pid:
-                    logger.info(
-                        f"Captured Chrome PID {chrome_pid} from launcher stdout | Port: {debug_port}"
-                    )
-                    break
+            if chrome_pid:
+                logger.info(
+                    f"Captured Chrome PID {chrome_pid} from launcher stdout | Port: {debug_port}"
+                )
         except asyncio.TimeoutError:
             logger.debug("Launcher stdout read timed out; using psutil fallback")
         except Exception as e:
             logger.debug(f"PID parse from launcher stdout failed: {e}")
-        finally:
-            try:
-                if process.stdout and not process.stdout.closed:
-                    process.stdout.close()
-            except Exception:
-                pass
 
         if chrome_pid is None:
             logger.debug(
-                f"Using psutil fallback to find Chrome PID on port {debug_port}"
+                f"Using TCP table fallback to find Chrome PID on port {debug_port}"
             )
-            deadline = 8.0
-            step = 0.25
-            waited = 0.0
-
-            while waited < deadline and chrome_pid is None:
+            # Wait for the listen socket first, then look its owner up once
+            # instead of re-reading the whole TCP table on a timer
+            fallback_start = loop.time()
+            if await self._wait_port_listening("127.0.0.1", debug_port, 8.0):
                 chrome_pid = await self._find_chrome_process_by_port(debug_port)
-                if chrome_pid:
-                    logger.info(
-                        f"Found Chrome PID {chrome_pid} via psutil fallback | "
-                        f"Port: {debug_port} | Took: {waited:.2f}s"
-                    )
-                    break
-                await asyncio.sleep(step)
-                waited += step
+                if chrome_pid is None:
+                    # Listener can show up in connect() a moment before the table
+                    await asyncio.sleep(0.25)
+                    chrome_pid = await self._find_chrome_process_by_port(debug_port)
+            if chrome_pid:
+                logger.info(
+                    f"Found Chrome PID {chrome_pid} via TCP table fallback | "
+                    f"Port: {debug_port} | Took: {loop.time() - fallback_start:.2f}s"
+                )
 
         if chrome_pid is None:
             try:
@@ -1165,8 +1600,9 @@ class BrowserLauncher:
             )
 
         try:
-            chrome_process = await asyncio.to_thread(psutil.Process, chrome_pid)
-            process_name = chrome_process.name().lower()
+            chrome_process, process_name = await asyncio.to_thread(
+                _inspect_process, chrome_pid
+            )
 
             if "chrome" not in process_name:
                 raise RuntimeError(
@@ -1186,6 +1622,7 @@ class BrowserLauncher:
                     f"DevTools not reachable on {host_for_probe}:{debug_port} within 90s"
                 )
 
+            wrapper.devtools_ready = True
             return wrapper
 
         except psutil.NoSuchProcess:
@@ -1196,12 +1633,41 @@ class BrowserLauncher:
             logger.error(f"Error creating Chrome wrapper: {e}")
             raise
 
-    async def _wait_devtools(
-        self, host: str, port: int, deadline: float = 90.0
+    async def _wait_devtools(
+        self, host: str, port: int, deadline: float = 90.0
+    ) -> bool:
+        """
+        Wait for Chrome DevTools to become available on a port.
+        Concurrent waits for the same port share one probe loop.
+
+        Returns:
+            True if DevTools became available, False if timeout
+        """
+        pending = self._devtools_waiters.get(port)
+        if pending is not None:
+            try:
+                return await asyncio.wait_for(asyncio.shield(pending), deadline)
+            except asyncio.TimeoutError:
+                return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._devtools_waiters[port] = waiter
+        ready = False
+        try:
+            ready = await self._probe_devtools_until_ready(host, port, deadline)
+            return ready
+        finally:
+            waiter.set_result(ready)
+            if self._devtools_waiters.get(port) is waiter:
+                del self._devtools_waiters[port]
+
+    async def _probe_devtools_until_ready(
+        self, host: str, port: int, deadline: float
     ) -> bool:
         """
-        Wait for Chrome DevTools to become available with exponential backoff.
-        Probes /json/version endpoint to verify Chrome is actually ready.
+        Wait for Chrome DevTools to become available.
+        Retries a cheap TCP connect until Chrome's listen socket appears, then
+        probes /json/version over that connection to verify Chrome is ready.
 
         Args:
             host: Host to connect to (usually 127.0.0.1)
@@ -1211,65 +1677,142 @@ class BrowserLauncher:
         Returns:
             True if DevTools became available, False if timeout
         """
-        url = f"http://{host}:{port}/json/version"
-        delay = 0.25
-        elapsed = 0.0
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        end = start + deadline
         attempt = 0
-        burst = 3
+        next_progress_log = start + 10.0
 
         logger.info(
             f"Waiting for Chrome DevTools on {host}:{port} (deadline: {deadline}s)"
         )
 
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=1.5)
-        ) as session:
-            while elapsed < deadline:
-                attempt += 1
+        while (now := loop.time()) < end:
+            attempt += 1
+            try:
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port), timeout=min(0.2, end - now)
+                )
+            except (OSError, asyncio.TimeoutError):
+                # Not listening yet - connect is refused immediately, retry quickly
+                if loop.time() >= next_progress_log:
+                    next_progress_log += 10.0
+                    logger.debug(
+                        f"Still waiting for DevTools on port {port} | "
+                        f"Elapsed: {loop.time() - start:.1f}s / {deadline}s"
+                    )
+                await asyncio.sleep(0.025)
+                continue
+
+            try:
+                browser_info = await asyncio.wait_for(
+                    self._probe_devtools_version(reader, writer, host, port),
+                    timeout=1.5,
+                )
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                browser_info = None
+            finally:
+                writer.close()
                 try:
-                    async with session.get(url) as response:  # type: aiohttp.ClientResponse
-                        if response.status == 200:
-                            browser_info = "unknown"
-                            try:
-                                data = await response.json()
-                                browser_info = data.get("Browser", "unknown")
-                            except Exception:
-                                pass
-
-                            logger.info(
-                                f"DevTools ready on port {port} | "
-                                f"Attempts: {attempt} | Elapsed: {elapsed:.2f}s | "
-                                f"Browser: {browser_info}"
-                            )
-                            return True
+                    await writer.wait_closed()
                 except Exception:
                     pass
 
-                sleep_time = 0.1 if attempt <= burst else delay
-                await asyncio.sleep(sleep_time)
-                elapsed += sleep_time
-
-                if attempt > burst:
-                    delay = min(delay * 1.7, 2.0)
+            if browser_info is not None:
+                logger.info(
+                    f"DevTools ready on port {port} | "
+                    f"Attempts: {attempt} | Elapsed: {loop.time() - start:.2f}s | "
+                    f"Browser: {browser_info}"
+                )
+                return True
 
-                if attempt % 10 == 0:
-                    logger.debug(
-                        f"Still waiting for DevTools on port {port} | "
-                        f"Elapsed: {elapsed:.1f}s / {deadline}s"
-                    )
+            # Listening but not serving /json/version yet - back off slightly
+            await asyncio.sleep(0.1)
 
         logger.error(
-            f"DevTools not ready on {host}:{port} after {elapsed:.1f}s | "
+            f"DevTools not ready on {host}:{port} after {loop.time() - start:.1f}s | "
             f"Attempts: {attempt}"
         )
         return False
 
+    @staticmethod
+    async def _probe_devtools_version(
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        host: str,
+        port: int,
+    ) -> str | None:
+        """
+        Send a minimal GET /json/version over an open connection.
+        Returns the reported browser version on HTTP 200, otherwise None.
+        """
+        writer.write(
+            f"GET /json/version HTTP/1.0\r\nHost: {host}:{port}\r\n"
+            f"Connection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, _, header_block = head.partition(b"\r\n")
+        status = status_line.split(None, 2)
+        if len(status) < 2 or status[1] != b"200":
+            return None
+
+        content_length = None
+        for line in header_block.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                try:
+                    content_length = int(value.strip())
+                except ValueError:
+                    pass
+                break
+
+        if content_length is not None:
+            body = await reader.readexactly(content_length)
+        else:
+            body = await reader.read()
+
+        try:
+            return json.loads(body).get("Browser", "unknown")
+        except Exception:
+            return "unknown"
+
+    async def _wait_port_listening(self, host: str, port: int, deadline: float) -> bool:
+        """Retry a TCP connect until something listens on host:port or deadline passes"""
+        loop = asyncio.get_running_loop()
+        end = loop.time() + deadline
+        while (now := loop.time()) < end:
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port), timeout=min(0.2, end - now)
+                )
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(0.025)
+                continue
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+            return True
+        return False
+
     async def _find_chrome_process_by_port(self, port: int) -> int | None:
         """Fast PID lookup via kernel TCP table (no netstat shellout)"""
+        hit = self._pid_port_cache.get(port)
+        if hit and time.monotonic() - hit[1] < self._pid_port_cache_ttl:
+            return hit[0]
+
         lookup_start = asyncio.get_event_loop().time()
 
         def _find_pid_by_port():
-            """Lookup PID using psutil TCP connections - much faster than netstat"""
+            """Lookup PID of the listener - targeted listener table on Windows, psutil otherwise"""
+            if _IS_WINDOWS:
+                try:
+                    return _find_listener_pid_windows(port)
+                except Exception as e:
+                    logger.debug(f"GetExtendedTcpTable lookup failed: {e}")
             try:
                 conns = psutil.net_connections(kind="tcp4")
                 for c in conns:
@@ -1298,6 +1841,7 @@ class BrowserLauncher:
             pid = await asyncio.to_thread(_find_pid_by_port)
             dur = asyncio.get_event_loop().time() - lookup_start
             if pid:
+                self._pid_port_cache[port] = (pid, time.monotonic())
                 logger.info(f"Found PID {pid} on port {port} | {dur:.3f}s")
             else:
                 logger.debug(f"No PID found on port {port} | {dur:.3f}s")
@@ -1307,11 +1851,25 @@ class BrowserLauncher:
             return None
 
     async def _find_chrome_executable(self) -> str:
+        """Return the Chrome executable path, cached for _chrome_exe_ttl seconds"""
+        if self._chrome_exe_cache and time.monotonic() < self._chrome_exe_expiry:
+            return self._chrome_exe_cache
+
+        async with self._chrome_exe_lock:
+            # Another launch may have finished discovery while we waited
+            if self._chrome_exe_cache and time.monotonic() < self._chrome_exe_expiry:
+                return self._chrome_exe_cache
+
+            path = await self._discover_chrome_executable()
+            self._chrome_exe_cache = path
+            self._chrome_exe_expiry = time.monotonic() + self._chrome_exe_ttl
+            return path
+
+    async def _discover_chrome_executable(self) -> str:
         """Find Chrome executable based on the operating system"""
-        system = platform.system().lower()
-        logger.debug(f"Finding Chrome executable on {system}")
+        logger.debug(f"Finding Chrome executable on {_SYSTEM}")
 
-        if system == "windows":
+        if _IS_WINDOWS:
             chrome_paths = [
                 "C:\\\\Program Files\\\\Google\\\\Chrome\\\\Application\\\\chrome.exe",
                 "C:\\\\Program Files (x86)\\\\Google\\\\Chrome\\\\Application\\\\chrome.exe",
@@ -1325,7 +1883,7 @@ class BrowserLauncher:
                     "%PROGRAMFILES(X86)%\\\\Google\\\\Chrome\\\\Application\\\\chrome.exe"
                 ),
             ]
-        elif system == "darwin":
+        elif _SYSTEM == "darwin":
             chrome_paths = [
                 "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
                 "/Applications/Chromium.app/Contents/MacOS/Chromium",
@@ -1333,7 +1891,7 @@ class BrowserLauncher:
                     "~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
                 ),
             ]
-        elif system == "linux":
+        elif _SYSTEM == "linux":
             chrome_paths = [
                 "/usr/bin/google-chrome",
                 "/usr/bin/google-chrome-stable",
@@ -1344,15 +1902,12 @@ class BrowserLauncher:
                 "/opt/google/chrome/google-chrome",
             ]
         else:
-            raise RuntimeError(f"Unsupported operating system: {system}")
+            raise RuntimeError(f"Unsupported operating system: {_SYSTEM}")
 
-        for path in chrome_paths:
-            if await asyncio.to_thread(os.path.exists, path):
-                if await asyncio.to_thread(os.access, path, os.X_OK):
-                    logger.info(f"Found Chrome at: {path}")
-                    return path
-                else:
-                    logger.warning(f"Chrome found at {path} but is not executable")
+        path = await asyncio.to_thread(_first_executable, chrome_paths)
+        if path:
+            logger.info(f"Found Chrome at: {path}")
+            return path
 
         for cmd in ["google-chrome", "chrome", "chromium", "chromium-browser"]:
             chrome_path = await asyncio.to_thread(shutil.which, cmd)
@@ -1360,7 +1915,7 @@ class BrowserLauncher:
                 logger.info(f"Found Chrome in PATH: {chrome_path}")
                 return chrome_path
 
-        raise RuntimeError(f"Chrome executable not found on {system} system")
+        raise RuntimeError(f"Chrome executable not found on {_SYSTEM} system")
 
     async def _build_chrome_command(
         self,
@@ -1376,32 +1931,9 @@ class BrowserLauncher:
         cmd = [
             chrome_exe,
             f"--remote-debugging-port={debug_port}",
-            "--remote-debugging-address=0.0.0.0",
             f"--user-data-dir={user_data_dir}",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--enable-automation",
-            "--disable-background-timer-throttling",
-            "--disable-backgrounding-occluded-windows",
-            "--disable-renderer-backgrounding",
-            "--disable-features=TranslateUI",
-            "--disable-ipc-flooding-protection",
-            "--disable-default-apps",
-            "--disable-hang-monitor",
-            "--disable-prompt-on-repost",
-            "--disable-sync",
-            "--metrics-recording-only",
-            "--no-service-autorun",
-            "--password-store=basic",
-            "--disable-extensions",
-            "--disable-component-extensions-with-background-pages",
-            "--disable-background-networking",
-            "--disable-breakpad",
-            "--disable-component-update",
-            "--disable-domain-reliability",
-            "--disable-features=OptimizationHints,MediaRouter",
-            "--disable-client-side-phishing-detection",
         ]
+        cmd.extend(_BASE_CHROME_ARGS)
 
         if proxy_config:
             proxy_server = proxy_config.get("server")
@@ -1433,35 +1965,6 @@ class BrowserLauncher:
                     cmd.append(f"--load-extension={ext_path}")
 
         if chrome_args:
-            dangerous_args = {
-                "--disable-web-security",
-                "--allow-file-access-from-files",
-                "--allow-file-access",
-                "--allow-running-insecure-content",
-                "--disable-site-isolation-trials",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-namespace-sandbox",
-                "--disable-seccomp-filter-sandbox",
-                "--allow-sandbox-debugging",
-                "--enable-logging",
-                "--log-file",
-                "--enable-dbus",
-                "--remote-debugging-address",
-                "--remote-debugging-port",
-                "--user-data-dir",
-                "--crash-dumps-dir",
-                "--homedir",
-                "--disk-cache-dir",
-                "--enable-local-file-accesses",
-                "--unlimited-storage",
-                "--allow-cross-origin-auth-prompt",
-                "--password-store",
-                "--enable-automation",
-            }
-
-            safe_arg_pattern = r"^--[a-z0-9\-]+(=[a-z0-9\-_\.,:/]+)?$"
-
             safe_args = []
             for arg in chrome_args:
                 if not isinstance(arg, str):
@@ -1473,29 +1976,24 @@ class BrowserLauncher:
                     continue
 
                 arg_name = arg.split("=")[0].lower()
-                if arg_name in dangerous_args:
+                if arg_name in _DANGEROUS_CHROME_ARGS:
                     logger.warning(f"Blocking dangerous chrome arg: {arg}")
                     continue
 
-                if not re.match(safe_arg_pattern, arg, re.IGNORECASE):
+                if not _SAFE_ARG_RE.match(arg):
                     logger.warning(f"Skipping chrome arg with invalid format: {arg}")
                     continue
 
                 if "=" in arg:
                     arg_key, arg_value = arg.split("=", 1)
 
-                    if any(
-                        path_word in arg_key for path_word in ["dir", "path", "file"]
-                    ):
+                    if any(w in arg_key for w in _PATH_WORDS):
                         logger.warning(
                             f"Blocking chrome arg with path reference: {arg}"
                         )
                         continue
 
-                    if any(
-                        proto in arg_value
-                        for proto in ["http://", "https://", "file://", "ftp://"]
-                    ):
+                    if any(proto in arg_value for proto in _URL_PROTOS):
                         logger.warning(f"Blocking chrome arg with URL: {arg}")
                         continue
 
@@ -1525,9 +2023,16 @@ class BrowserLauncher:
             session_data = {
                 "process_id": session.process_id,
                 "process_create_time": getattr(session, "process_create_time", None),
+                "process_name": getattr(session, "process_name", None),
+                "process_object": getattr(session, "process_object", None),
                 "debug_port": session.debug_port,
+                "debug_port_arg": f"--remote-debugging-port={session.debug_port}",
                 "user_data_dir": session.user_data_dir,
-                "created_at": session.created_at,
+                "is_temp_profile": bool(
+                    session.user_data_dir
+                    and _TEMP_PROFILE_RE.search(session.user_data_dir)
+                ),
+                "created_at_monotonic": session.created_at_monotonic,
                 "worker_id": session.worker_id,
                 "request_id": session.request_id,
                 "machine_ip": session.machine_ip,
@@ -1537,17 +2042,17 @@ class BrowserLauncher:
             }
 
             del self.sessions[worker_id]
+            self._sessions_snapshot = tuple(self.sessions.values())
             # Note: _worker_to_port cleanup handled by _release_port() later
 
         killed = True
+        exit_confirmed = False  # set once we've observed the process exit
         pid = None  # Initialize to prevent "referenced before assignment" error
         try:
             pid = session_data["process_id"]
 
             if pid:
-                system = platform.system().lower()
-
-                if system == "windows":
+                if _IS_WINDOWS:
                     # Use taskkill /T to kill entire process tree
                     # This is the most reliable way on Windows to kill Chrome and all children
                     try:
@@ -1568,12 +2073,13 @@ class BrowserLauncher:
                             logger.warning(f"taskkill timeout for PID {pid} after 10s")
                             killed = False
 
-                        # Verify process is actually dead
-                        await asyncio.sleep(0.2)
-                        if await asyncio.to_thread(psutil.pid_exists, pid):
+                        # Verify process is actually dead (checks immediately,
+                        # then backs off from 20ms for up to 0.2s)
+                        if not await _wait_for_pid_exit(pid, 0.2):
                             logger.warning(f"Process {pid} still alive after taskkill")
                             killed = False
                         else:
+                            exit_confirmed = True
                             logger.debug(
                                 f"Successfully killed process tree for PID {pid}"
                             )
@@ -1581,52 +2087,50 @@ class BrowserLauncher:
                         logger.error(f"Failed to kill process {pid}: {e}")
                         killed = False
                 else:
-                    # Linux/Mac: Kill children first, then parent
+                    # Linux/Mac: Kill the whole process tree
                     try:
                         parent = psutil.Process(pid)
-                        children = parent.children(recursive=True)
 
-                        # Kill all children first (bottom-up)
-                        for child in children:
-                            try:
-                                child.kill()
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-
-                        # Kill parent
-                        await asyncio.to_thread(os.kill, pid, 9)  # SIGKILL
+                        if os.getpgid(pid) == pid:
+                            # Chrome is spawned as a process-group leader, so one
+                            # killpg takes every child without walking /proc
+                            await asyncio.to_thread(os.killpg, pid, signal.SIGKILL)
+                        else:
+                            # Not our group leader (e.g. found by port) - never
+                            # killpg a group we might share; kill the tree by PID
+                            await asyncio.to_thread(_kill_process_tree, parent)
 
-                        # Wait longer for all Chrome processes to die (up to 10s total)
-                        # Check multiple times with exponential backoff
+                        # Block on the exit notification instead of polling
+                        # pid_exists. Our own child is reaped by the event loop's
+                        # child watcher; anything else is waited on via psutil.
                         max_wait = 10.0
-                        elapsed = 0.0
-                        wait_interval = 0.2
-
-                        while elapsed < max_wait:
-                            await asyncio.sleep(wait_interval)
-                            elapsed += wait_interval
-
-                            if not await asyncio.to_thread(psutil.pid_exists, pid):
-                                logger.debug(
-                                    f"Successfully killed process tree for PID {pid} in {elapsed:.1f}s"
+                        proc_obj = session_data["process_object"]
+                        try:
+                            if (
+                                isinstance(proc_obj, LauncherProcess)
+                                and proc_obj.pid == pid
+                            ):
+                                await asyncio.wait_for(
+                                    proc_obj.wait(), timeout=max_wait
                                 )
-                                break
-
-                            # Exponential backoff: increase wait time
-                            wait_interval = min(wait_interval * 1.5, 1.0)
-                        else:
-                            # Timeout reached, process still alive
+                            else:
+                                await asyncio.to_thread(parent.wait, max_wait)
+                            exit_confirmed = True
+                            logger.debug(
+                                f"Successfully killed process tree for PID {pid}"
+                            )
+                        except (asyncio.TimeoutError, psutil.TimeoutExpired):
                             logger.warning(
                                 f"Process {pid} still alive after {max_wait}s"
                             )
                             killed = False
                     except (psutil.NoSuchProcess, ProcessLookupError):
-                        pass  # Already dead
+                        exit_confirmed = True  # Already dead
                     except Exception as e:
                         logger.error(f"Failed to kill process {pid}: {e}")
                         killed = False
 
-            duration = (datetime.now(UTC) - session_data["created_at"]).total_seconds()
+            duration = time.monotonic() - session_data["created_at_monotonic"]
             logger.info(
                 f"Browser terminated | Worker: {worker_id[:8]} | "
                 f"Reason: {termination_reason} | "
@@ -1642,172 +2146,121 @@ class BrowserLauncher:
                 exit_code=None,
                 session_duration_seconds=duration,
             )
-            self.terminated_sessions.append(terminated)
-            if len(self.terminated_sessions) > self._max_terminated_history:
-                self.terminated_sessions = self.terminated_sessions[
-                    -self._max_terminated_history :
-                ]
-
-            user_data_dir = session_data.get("user_data_dir")
-            is_temp_profile = user_data_dir and (
-                "chrome_profile_" in user_data_dir or "Chrome-RDP" in user_data_dir
-            )
+            self._push_terminated(terminated)
 
-            if is_temp_profile and not settings.profile_reuse_enabled:
-                system = platform.system().lower()
-                if system == "windows":
+            user_data_dir = session_data["user_data_dir"]
+            if session_data["is_temp_profile"] and not settings.profile_reuse_enabled:
+                if _IS_WINDOWS:
                     self._cleanup_profile_directory_bat(user_data_dir)
                 else:
-                    task = asyncio.create_task(
-                        self._cleanup_profile_directory_async(user_data_dir)
-                    )
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
+                    self._enqueue_profile_cleanup(user_data_dir)
 
         except Exception as e:
             logger.error(f"Failed to terminate session {worker_id}: {e}")
             killed = False
         finally:
-            # Final PID check BEFORE releasing resources
-            try:
-                pid = session_data.get("process_id") if session_data else None
-                if pid and killed:
-                    if await asyncio.to_thread(psutil.pid_exists, pid):
-                        killed = False
-                        logger.warning(
-                            f"Process {pid} still alive after termination attempt - "
-                            f"attempting aggressive force kill"
-                        )
-                        # Aggressive force kill attempt with PID-reuse validation
-                        try:
-                            proc = psutil.Process(pid)
-                            # Validate PID hasn't been reused (compare create_time)
-                            process_create_time = session_data.get(
-                                "process_create_time"
-                            )
+            killed = await self._finalize_termination(
+                worker_id, session_data, killed, exit_confirmed
+            )
 
-                            # Conservative fallback: only kill if we can verify it's the same process
-                            if process_create_time is None:
-                                # Fallback: verify process name and cmdline match our Chrome instance
-                                try:
-                                    name_ok = (
-                                        proc.name()
-                                        .lower()
-                                        .startswith(("chrome", "msedge"))
-                                    )
-                                    cmd = (
-                                        " ".join(proc.cmdline())
-                                        if proc.cmdline()
-                                        else ""
-                                    )
-                                    port_str = f"--remote-debugging-port={session_data.get('debug_port')}"
-                                    if not (name_ok and port_str in cmd):
-                                        logger.warning(
-                                            f"PID {pid} has no stored create_time and fallback guards failed - "
-                                            f"skipping aggressive kill to avoid potential PID-reuse race"
-                                        )
-                                        proc = None
-                                    else:
-                                        logger.info(
-                                            f"PID {pid} has no create_time but name/cmdline match - "
-                                            f"proceeding with aggressive kill"
-                                        )
-                                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                    logger.warning(
-                                        f"PID {pid} - cannot verify process identity, skipping kill"
-                                    )
-                                    proc = None
-                            else:
-                                # We have create_time, validate it matches
-                                current_create_time = proc.create_time()
-                                time_diff = abs(
-                                    current_create_time - process_create_time
-                                )
-                                if time_diff > 1.0:
-                                    logger.warning(
-                                        f"PID {pid} create_time changed (diff: {time_diff:.2f}s) - "
-                                        f"skipping aggressive kill to avoid PID-reuse race"
-                                    )
-                                    proc = None
-
-                            if proc:
-                                # Kill all children first
-                                for child in proc.children(recursive=True):
-                                    try:
-                                        child.kill()
-                                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                        pass
-                                # Force kill parent
-                                proc.kill()
-                                # Wait briefly and check again
-                                await asyncio.sleep(0.5)
-                                if not await asyncio.to_thread(psutil.pid_exists, pid):
-                                    killed = True
-                                    logger.info(
-                                        f"Aggressive kill succeeded for PID {pid}"
-                                    )
-                        except (
-                            psutil.NoSuchProcess,
-                            psutil.AccessDenied,
-                            Exception,
-                        ) as e:
-                            logger.warning(f"Aggressive kill failed for PID {pid}: {e}")
-            except Exception:
-                pass
+        return killed
 
-            if session_data:
-                try:
-                    # Always release port to prevent leaks
-                    # Even if process is alive, port will be reused when process dies
-                    await self._release_port(session_data["debug_port"])
-                    if not killed and pid:
-                        logger.warning(
-                            f"Port {session_data['debug_port']} released despite process {pid} still running - "
-                            f"port may be in use until process dies"
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to release port {session_data['debug_port']}: {e}"
-                    )
+    async def _finalize_termination(
+        self, worker_id: str, session_data: dict, killed: bool, exit_confirmed: bool
+    ) -> bool:
+        """
+        Release everything a terminated session held; returns the final killed state.
+        Runs the PID-reuse-safe force kill first if the process may still be alive.
+        """
+        pid = session_data["process_id"]
 
+        # Final PID check BEFORE releasing resources; force kill (with PID-reuse
+        # validation) if the process survived the termination attempt
+        if pid and killed and not exit_confirmed:
             try:
-                idle_tracking = getattr(self, "_idle_tracking", None)
-                if idle_tracking is not None and worker_id in idle_tracking:
-                    del idle_tracking[worker_id]
-                    logger.debug(
-                        f"Cleaned up idle tracking for session {worker_id[:8]}"
+                if await asyncio.to_thread(psutil.pid_exists, pid):
+                    killed = False
+                    logger.warning(
+                        f"Process {pid} still alive after termination attempt - "
+                        f"attempting aggressive force kill"
                     )
-                idle_checks = getattr(self, "_idle_check_count", None)
-                if idle_checks is not None and worker_id in idle_checks:
-                    del idle_checks[worker_id]
+                    try:
+                        proc = await asyncio.to_thread(
+                            _verify_session_process,
+                            pid,
+                            session_data.get("process_create_time"),
+                            session_data.get("process_name"),
+                            session_data["debug_port_arg"],
+                        )
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        logger.warning(
+                            f"PID {pid} - cannot verify process identity, skipping kill"
+                        )
+                        proc = None
+
+                    if proc:
+                        await asyncio.to_thread(_kill_process_tree, proc)
+                        # Killed processes usually go within milliseconds
+                        if await _wait_for_pid_exit(pid, 0.5):
+                            killed = True
+                            logger.info(f"Aggressive kill succeeded for PID {pid}")
             except Exception as e:
-                logger.debug(f"Idle-tracking cleanup skipped: {e}")
+                logger.warning(f"Aggressive kill failed for PID {pid}: {e}")
 
-            if session_data:
-                try:
-                    system = platform.system().lower()
-                    # Always cleanup port-proxy on Windows (unconditional)
-                    if system == "windows":
-                        self._remove_windows_port_forwarding_bat(
-                            session_data["debug_port"]
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to cleanup port forwarding for {session_data['debug_port']}: {e}"
-                    )
+        self._idle_tracking.pop(worker_id, None)
+        self._idle_check_count.pop(worker_id, None)
+
+        debug_port = session_data["debug_port"]
+        try:
+            # Cleanup port-proxy on Windows (no-op when the custom launcher owns it)
+            if _IS_WINDOWS:
+                self._queue_port_forwarding_removal(debug_port)
+
+            # Always release port to prevent leaks
+            # Even if process is alive, port will be reused when process dies
+            await self._release_port(debug_port)
+            if not killed and pid:
+                logger.warning(
+                    f"Port {debug_port} released despite process {pid} still running - "
+                    f"port may be in use until process dies"
+                )
+        except Exception as e:
+            logger.error(
+                f"Failed to finalize termination of {worker_id[:8]} | Port: {debug_port}: {e}"
+            )
 
         return killed
 
     async def _cleanup_profile_directory_async(self, user_data_dir: str):
         """Async profile cleanup for Linux/Mac (fire-and-forget)"""
         try:
-            if await asyncio.to_thread(os.path.exists, user_data_dir):
-                await asyncio.to_thread(
-                    shutil.rmtree, user_data_dir, ignore_errors=True
-                )
+            await asyncio.to_thread(shutil.rmtree, user_data_dir, ignore_errors=True)
         except Exception:
             pass
 
+    def _enqueue_profile_cleanup(self, user_data_dir: str):
+        """Queue a profile directory for deletion by the cleanup workers"""
+        if not self._profile_cleanup_workers:
+            self._profile_cleanup_workers = [
+                asyncio.create_task(self._profile_cleanup_worker())
+                for _ in range(self._profile_cleanup_concurrency)
+            ]
+        try:
+            self._profile_cleanup_queue.put_nowait(user_data_dir)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Profile cleanup queue full - leaving {user_data_dir} in place"
+            )
+
+    async def _profile_cleanup_worker(self):
+        """Delete queued profile directories one at a time"""
+        while True:
+            user_data_dir = await self._profile_cleanup_queue.get()
+            try:
+                await self._cleanup_profile_directory_async(user_data_dir)
+            finally:
+                self._profile_cleanup_queue.task_done()
+
     def cleanup_old_profiles_bat(self):
         """
         Fire-and-forget old profile cleanup using BAT script.
@@ -1815,8 +2268,7 @@ class BrowserLauncher:
         Only deletes directories matching profile patterns (p*, chrome_profile_*).
         """
         try:
-            system = platform.system().lower()
-            if system != "windows":
+            if not _IS_WINDOWS:
                 logger.debug("BAT script cleanup only available on Windows")
                 return
 
@@ -1832,26 +2284,13 @@ class BrowserLauncher:
             else:
                 basedir = tempfile.gettempdir()
 
-            script_dir = os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            )
-            bat_script = os.path.join(script_dir, "scripts", "cleanup_old_profiles.bat")
-
-            if not os.path.exists(bat_script):
-                logger.warning(f"cleanup_old_profiles.bat not found at {bat_script}")
+            bat_script = _BAT_SCRIPTS["cleanup_old_profiles.bat"]
+            if bat_script is None:
+                logger.warning(f"cleanup_old_profiles.bat not found in {_SCRIPTS_DIR}")
                 return
 
-            subprocess.Popen(
-                [
-                    bat_script,
-                    basedir,
-                    str(settings.profile_max_age_hours),
-                ],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                creationflags=subprocess.CREATE_NO_WINDOW
-                if hasattr(subprocess, "CREATE_NO_WINDOW")
-                else 0,
+            self._run_in_windows_helper(
+                bat_script, basedir, str(settings.profile_max_age_hours)
             )
             logger.info(
                 f"Started background cleanup for profile folders older than {settings.profile_max_age_hours}h in {basedir}"
@@ -1861,7 +2300,7 @@ class BrowserLauncher:
             logger.warning(f"Failed to start old profile cleanup script: {e}")
 
     async def _check_chrome_activity(self, debug_port: int) -> tuple[bool, bool, bool]:
-        """Fast CDP activity monitoring with TCP pre-probe and shared HTTP session.
+        """Fast CDP activity monitoring over the shared keep-alive HTTP session.
 
         Returns:
             tuple[bool, bool, bool]: (has_pages, has_real_content, has_websocket)
@@ -1869,40 +2308,29 @@ class BrowserLauncher:
             - has_real_content: True if browser has any non-blank page
             - has_websocket: True if any page has an active WebSocket connection
         """
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(0.1)
-            try:
-                if s.connect_ex(("127.0.0.1", debug_port)) != 0:
-                    return (False, False, False)
-            finally:
-                try:
-                    s.close()
-                except Exception:
-                    pass
-        except Exception:
-            return (False, False, False)
-
+        # No separate TCP pre-probe: the session's 0.1s connect timeout fails a
+        # dead port just as fast without blocking the loop, and live ports reuse
+        # a pooled keep-alive connection instead of a fresh handshake
         try:
             http = await self._get_http()
             url = f"http://127.0.0.1:{debug_port}/json/list"
             async with http.get(url) as response:
                 if response.status != 200:
                     logger.debug(
-                        f"Chrome debug API returned {response.status} on port {debug_port}"
+                        "Chrome debug API returned %s on port %s",
+                        response.status,
+                        debug_port,
                     )
                     return (False, False, False)
 
-                content = await response.text()
-                if not content or content.strip() == "":
-                    logger.debug(
-                        f"Chrome debug API returned empty response on port {debug_port}"
-                    )
-                    return (False, False, False)
+                # Parse the raw bytes; json.loads detects the encoding itself,
+                # so there's no intermediate str decode
+                body = await response.read()
 
             try:
-                targets = json.loads(content)
-            except json.JSONDecodeError:
+                targets = json.loads(body)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # Also covers an empty body
                 logger.debug(
                     f"Chrome debug API returned invalid JSON on port {debug_port}"
                 )
@@ -1918,43 +2346,38 @@ class BrowserLauncher:
             has_real_content = False
             has_websocket = False
 
-            for t in targets:
-                if not isinstance(t, dict):
-                    continue
-                if t.get("type") == "page":
-                    page_count += 1
-                    url_str = t.get("url", "")
-
-                    if url_str not in [
-                        "about:blank",
-                        "chrome://newtab/",
-                        "chrome://new-tab-page/",
-                        "",
-                        "data:",
-                    ]:
-                        has_real_content = True
-
-                    if "webSocketDebuggerUrl" in t:
-                        has_websocket = True
+            pages = (
+                t for t in targets if isinstance(t, dict) and t.get("type") == "page"
+            )
+            for t in pages:
+                page_count += 1
+                if t.get("url", "") not in _BLANK_URLS:
+                    has_real_content = True
+                if "webSocketDebuggerUrl" in t:
+                    has_websocket = True
 
             has_pages = page_count > 0
 
             if has_pages:
                 logger.debug(
-                    f"Port {debug_port} has {page_count} page(s), real_content={has_real_content}, websocket={has_websocket}"
+                    "Port %s has %d page(s), real_content=%s, websocket=%s",
+                    debug_port,
+                    page_count,
+                    has_real_content,
+                    has_websocket,
                 )
             else:
-                logger.debug(f"Port {debug_port} has no pages - browser disconnected")
+                logger.debug("Port %s has no pages - browser disconnected", debug_port)
 
             return (has_pages, has_real_content, has_websocket)
 
         except aiohttp.ClientError as e:
             logger.debug(
-                f"Chrome debug API connection failed on port {debug_port}: {e}"
+                "Chrome debug API connection failed on port %s: %s", debug_port, e
             )
             return (False, False, False)
         except asyncio.TimeoutError:
-            logger.debug(f"Chrome debug API timeout on port {debug_port}")
+            logger.debug("Chrome debug API timeout on port %s", debug_port)
             return (False, False, False)
         except Exception as e:
             logger.debug(f"Error checking Chrome activity on port {debug_port}: {e}")
@@ -1971,44 +2394,78 @@ class BrowserLauncher:
         self._cleanup_running = True
         try:
             cleanup_start = asyncio.get_event_loop().time()
+            # One reference instant for the whole sweep: wall clock for expires_at,
+            # monotonic for session age
             now = datetime.now(UTC)
+            mono_now = time.monotonic()
             sessions_to_check = list(self.sessions.items())
             terminated_count = 0
             timeout_count = 0
             skipped_count = 0
 
+            # Custom-launcher sessions are reaped in one sweep per cycle rather
+            # than one executor hop per session inside the checks
+            wrappers = [
+                s.process_object
+                for _, s in sessions_to_check
+                if isinstance(s.process_object, ChromeProcessWrapper)
+                and s.process_object.returncode is None
+            ]
+            if wrappers:
+                try:
+                    await asyncio.to_thread(ChromeProcessWrapper.sweep, wrappers)
+                except Exception as e:
+                    logger.debug(f"Chrome process sweep failed: {e}")
+
             GLOBAL_CLEANUP_TIMEOUT = 120.0
             PER_SESSION_TIMEOUT = 10.0
+            MAX_CONCURRENT_CHECKS = 16
 
-            for worker_id, session in sessions_to_check:
-                elapsed = asyncio.get_event_loop().time() - cleanup_start
-                if elapsed > GLOBAL_CLEANUP_TIMEOUT:
-                    remaining_sessions = len(sessions_to_check) - (
-                        terminated_count + timeout_count + skipped_count
-                    )
-                    logger.warning(
-                        f"Cleanup global timeout ({GLOBAL_CLEANUP_TIMEOUT}s) exceeded - "
-                        f"skipping {remaining_sessions} remaining sessions"
-                    )
-                    break
-
-                try:
-                    remaining_time = max(1.0, GLOBAL_CLEANUP_TIMEOUT - elapsed)
-                    session_timeout = min(PER_SESSION_TIMEOUT, remaining_time)
+            # Checks are mostly I/O (CDP HTTP, psutil in threads), so fan them out
+            # under a semaphore instead of paying N x per-check latency serially
+            check_slots = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
 
+            async def guarded_check(worker_id: str, session: BrowserSession):
+                async with check_slots:
                     await asyncio.wait_for(
-                        self._check_and_cleanup_session(worker_id, session, now),
-                        timeout=session_timeout,
+                        self._check_and_cleanup_session(
+                            worker_id, session, now, mono_now
+                        ),
+                        timeout=PER_SESSION_TIMEOUT,
                     )
+
+            tasks = [
+                asyncio.create_task(guarded_check(worker_id, session))
+                for worker_id, session in sessions_to_check
+            ]
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*tasks, return_exceptions=True),
+                    timeout=GLOBAL_CLEANUP_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                # wait_for cancelled the gather; let the cancelled checks settle
+                await asyncio.gather(*tasks, return_exceptions=True)
+                logger.warning(
+                    f"Cleanup global timeout ({GLOBAL_CLEANUP_TIMEOUT}s) exceeded - "
+                    f"skipping {sum(t.cancelled() for t in tasks)} remaining sessions"
+                )
+
+            for (worker_id, session), task in zip(sessions_to_check, tasks):
+                if task.cancelled():
+                    skipped_count += 1
+                    continue
+                exc = task.exception()
+                if exc is None:
                     if worker_id not in self.sessions:
                         terminated_count += 1
-                except asyncio.TimeoutError:
+                elif isinstance(exc, asyncio.TimeoutError):
                     timeout_count += 1
                     logger.warning(
                         f"Session check timeout for {worker_id[:8]} | Port: {session.debug_port} - skipping"
                     )
-                except Exception as e:
-                    logger.error(f"Error checking session {worker_id[:8]}: {e}")
+                else:
+                    logger.error(f"Error checking session {worker_id[:8]}: {exc}")
                     skipped_count += 1
 
             cleanup_duration = asyncio.get_event_loop().time() - cleanup_start
@@ -2028,12 +2485,20 @@ class BrowserLauncher:
             self._cleanup_running = False
 
     async def _check_and_cleanup_session(
-        self, worker_id: str, session: BrowserSession, now: datetime
+        self,
+        worker_id: str,
+        session: BrowserSession,
+        now: datetime,
+        mono_now: float,
     ):
-        """Check a single session and clean up if needed - with timeout protection"""
+        """
+        Check a single session and clean up if needed - with timeout protection.
+        `now`/`mono_now` are the sweep's wall-clock and time.monotonic() samples.
+        """
         check_start_time = asyncio.get_event_loop().time()
 
-        session_age = (now - session.created_at).total_seconds() / 60
+        session_age_seconds = mono_now - session.created_at_monotonic
+        session_age = session_age_seconds / 60
 
         if session_age > settings.hard_ttl_minutes:
             logger.warning(
@@ -2075,8 +2540,8 @@ class BrowserLauncher:
                     if poll_result is not None:
                         process_is_running = False
                         exit_code = poll_result
-            else:
-
+            elif _IS_WINDOWS:
+                # os.kill(pid, 0) would terminate the process on Windows
                 def check_process_running(pid):
                     try:
                         proc = psutil.Process(pid)
@@ -2092,14 +2557,28 @@ class BrowserLauncher:
                     asyncio.to_thread(check_process_running, session.process_id),
                     timeout=5.0,
                 )
+            else:
+                # Signal 0 is a single kill(2) existence check - cheap enough to
+                # run inline instead of hopping to a thread for psutil
+                try:
+                    os.kill(session.process_id, 0)
+                except ProcessLookupError:
+                    process_is_running, exit_code = False, 0
+                except PermissionError:
+                    pass  # Exists, but owned by another user
 
             process_check_duration = (
                 asyncio.get_event_loop().time() - process_check_start
             )
-            logger.debug(
-                f"Process check completed | Worker: {worker_id[:8]} | Port: {session.debug_port} | "
-                f"Duration: {process_check_duration:.2f}s | Status: {'running' if process_is_running else 'stopped'}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Process check completed | Worker: %s | Port: %d | "
+                    "Duration: %.2fs | Status: %s",
+                    worker_id[:8],
+                    session.debug_port,
+                    process_check_duration,
+                    "running" if process_is_running else "stopped",
+                )
 
         except asyncio.TimeoutError:
             process_check_duration = (
@@ -2115,8 +2594,6 @@ class BrowserLauncher:
             exit_code = 0
 
         if process_is_running:
-            session_age_seconds = (now - session.created_at).total_seconds()
-
             (
                 has_pages,
                 has_real_content,
@@ -2149,14 +2626,11 @@ class BrowserLauncher:
                 termination_reason = "closed"
                 logger.info(f"Browser closed | Worker: {worker_id[:8]}")
 
-            system = platform.system().lower()
-            if system == "windows":
+            if _IS_WINDOWS:
                 profile_dir = (
                     session.user_data_dir if hasattr(session, "user_data_dir") else None
                 )
-                is_temp_profile = profile_dir and (
-                    "chrome_profile_" in profile_dir or "Chrome-RDP" in profile_dir
-                )
+                is_temp_profile = profile_dir and _TEMP_PROFILE_RE.search(profile_dir)
 
                 cleanup_profile = (
                     profile_dir
@@ -2185,12 +2659,49 @@ class BrowserLauncher:
                 f"Session check slow | Worker: {worker_id[:8]} | Port: {session.debug_port} | "
                 f"Total duration: {total_check_duration:.2f}s"
             )
-        else:
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Session check complete | Worker: {worker_id[:8]} | "
-                f"Total duration: {total_check_duration:.2f}s"
+                "Session check complete | Worker: %s | Total duration: %.2fs",
+                worker_id[:8],
+                total_check_duration,
             )
 
+    async def _record_external_termination(
+        self, worker_id: str, termination_reason: str, exit_code: int | None
+    ) -> TerminatedSession | None:
+        """
+        Remove a session from tracking and record it as terminated.
+        Only the dict pop/lookup runs under _session_lock; history bookkeeping
+        happens after. Returns None (after releasing any stale port) if the
+        session was already gone.
+        """
+        async with self._session_lock:
+            session = self.sessions.pop(worker_id, None)
+            if session:
+                self._sessions_snapshot = tuple(self.sessions.values())
+            stale_port = None if session else self._worker_to_port.get(worker_id)
+
+        if session is None:
+            # Whoever removed it already recorded the termination
+            logger.warning(f"Session {worker_id} not found for cleanup")
+            if stale_port:
+                await self._release_port(stale_port)
+            return None
+
+        terminated = TerminatedSession(
+            worker_id=session.worker_id,
+            request_id=session.request_id,
+            machine_ip=session.machine_ip,
+            debug_port=session.debug_port,
+            process_id=session.process_id,
+            termination_reason=termination_reason,
+            exit_code=exit_code,
+            session_duration_seconds=time.monotonic() - session.created_at_monotonic,
+        )
+        self._push_terminated(terminated)
+        # Note: _worker_to_port cleanup handled by _release_port() in the caller
+        return terminated
+
     async def _cleanup_terminated_session_tracking_only(
         self,
         worker_id: str,
@@ -2201,59 +2712,19 @@ class BrowserLauncher:
         Update session tracking only (for when BAT script handles actual cleanup).
         This is instant and non-blocking - just updates internal state.
         """
-        session = None
-        debug_port = None
-
-        async with self._session_lock:
-            session = self.sessions.get(worker_id)
-            if not session:
-                logger.warning(f"Session {worker_id} not found for cleanup")
-                stale_port = self._worker_to_port.get(worker_id)
-                self.terminated_sessions.append(
-                    TerminatedSession(
-                        worker_id=worker_id,
-                        request_id=None,
-                        machine_ip=None,
-                        debug_port=stale_port,
-                        process_id=None,
-                        termination_reason=termination_reason,
-                        exit_code=exit_code,
-                        session_duration_seconds=0.0,
-                    )
-                )
-                if stale_port:
-                    await self._release_port(stale_port)
-                return
-
-            debug_port = session.debug_port
-            duration = (datetime.now(UTC) - session.created_at).total_seconds()
-
-            terminated = TerminatedSession(
-                worker_id=session.worker_id,
-                request_id=session.request_id,
-                machine_ip=session.machine_ip,
-                debug_port=session.debug_port,
-                process_id=session.process_id,
-                termination_reason=termination_reason,
-                exit_code=exit_code,
-                session_duration_seconds=duration,
-            )
-
-            self.terminated_sessions.append(terminated)
-
-            if len(self.terminated_sessions) > self._max_terminated_history:
-                self.terminated_sessions = self.terminated_sessions[
-                    -self._max_terminated_history :
-                ]
-
-            logger.info(
-                f"Session cleanup delegated to BAT | {worker_id[:8]} | "
-                f"Port: {debug_port} | Duration: {duration:.1f}s"
-            )
+        terminated = await self._record_external_termination(
+            worker_id, termination_reason, exit_code
+        )
+        if terminated is None:
+            return
 
-            if worker_id in self.sessions:
-                del self.sessions[worker_id]
-            # Note: _worker_to_port cleanup handled by _release_port() below
+        debug_port = terminated.debug_port
+        logger.info(
+            "Session cleanup delegated to BAT | %s | Port: %s | Duration: %.1fs",
+            worker_id[:8],
+            debug_port,
+            terminated.session_duration_seconds,
+        )
 
         if debug_port:
             await self._release_port(debug_port)  # Clears _worker_to_port
@@ -2265,82 +2736,40 @@ class BrowserLauncher:
         exit_code: int | None = None,
     ):
         """Clean up a session that was terminated externally"""
-        session = None
-        debug_port = None
-
-        async with self._session_lock:
-            session = self.sessions.get(worker_id)
-            if not session:
-                logger.warning(f"Session {worker_id} not found for cleanup")
-                stale_port = self._worker_to_port.get(worker_id)
-                self.terminated_sessions.append(
-                    TerminatedSession(
-                        worker_id=worker_id,
-                        request_id=None,
-                        machine_ip=None,
-                        debug_port=stale_port,
-                        process_id=None,
-                        termination_reason=termination_reason,
-                        exit_code=exit_code,
-                        session_duration_seconds=0.0,
-                    )
-                )
-                if stale_port:
-                    await self._release_port(stale_port)
-                return
-
-            debug_port = session.debug_port
-            duration = (datetime.now(UTC) - session.created_at).total_seconds()
-
-            terminated = TerminatedSession(
-                worker_id=session.worker_id,
-                request_id=session.request_id,
-                machine_ip=session.machine_ip,
-                debug_port=session.debug_port,
-                process_id=session.process_id,
-                termination_reason=termination_reason,
-                exit_code=exit_code,
-                session_duration_seconds=duration,
-            )
-
-            self.terminated_sessions.append(terminated)
-
-            if len(self.terminated_sessions) > self._max_terminated_history:
-                self.terminated_sessions = self.terminated_sessions[
-                    -self._max_terminated_history :
-                ]
-
-            logger.info(
-                f"Cleaning up browser session: {worker_id} | "
-                f"Port: {debug_port} | Duration: {duration:.1f}s"
-            )
+        terminated = await self._record_external_termination(
+            worker_id, termination_reason, exit_code
+        )
+        if terminated is None:
+            return
 
-            if worker_id in self.sessions:
-                del self.sessions[worker_id]
-            # Note: _worker_to_port cleanup handled by _release_port() below
+        debug_port = terminated.debug_port
+        logger.info(
+            "Cleaning up browser session: %s | Port: %s | Duration: %.1fs",
+            worker_id,
+            debug_port,
+            terminated.session_duration_seconds,
+        )
 
         if debug_port:
-            system = platform.system().lower()
-            # Always cleanup port-proxy on Windows (unconditional)
-            if system == "windows":
-                self._remove_windows_port_forwarding_bat(debug_port)
+            # Cleanup port-proxy on Windows (no-op when the custom launcher owns it)
+            if _IS_WINDOWS:
+                self._queue_port_forwarding_removal(debug_port)
 
             await self._release_port(debug_port)  # Clears _worker_to_port
 
     def get_active_sessions(self) -> list:
-        """Get list of active sessions"""
-        sessions_snapshot = list(self.sessions.values())
-        return [
-            {
-                "worker_id": session.worker_id,
-                "request_id": session.request_id,
-                "debug_port": session.debug_port,
-                "machine_ip": session.machine_ip,
-                "created_at": session.created_at.isoformat(),
-                "expires_at": session.expires_at.isoformat(),
-            }
-            for session in sessions_snapshot
-        ]
+        """Get list of active sessions (shared per-session dicts - treat as read-only)"""
+        return [session.summary for session in self._sessions_snapshot]
+
+    def _push_terminated(self, terminated: TerminatedSession):
+        """Append to the history deque and keep the per-worker index in step"""
+        history = self.terminated_sessions
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            if self._terminated_by_worker.get(evicted.worker_id) is evicted:
+                del self._terminated_by_worker[evicted.worker_id]
+        history.append(terminated)
+        self._terminated_by_worker[terminated.worker_id] = terminated
 
     def get_terminated_sessions(
         self, worker_id: str | None = None
@@ -2348,7 +2777,7 @@ class BrowserLauncher:
         """Get terminated session information"""
         if worker_id:
             return [s for s in self.terminated_sessions if s.worker_id == worker_id]
-        return self.terminated_sessions.copy()
+        return list(self.terminated_sessions)
 
     def get_session_status(self, worker_id: str) -> dict:
         """Get status of a session (active or terminated)"""
@@ -2361,13 +2790,12 @@ class BrowserLauncher:
                 "machine_ip": session.machine_ip,
                 "debug_port": session.debug_port,
                 "process_id": session.process_id,
-                "created_at": session.created_at.isoformat(),
-                "expires_at": session.expires_at.isoformat(),
+                "created_at": session.created_at_iso,
+                "expires_at": session.expires_at_iso,
             }
 
-        terminated = [s for s in self.terminated_sessions if s.worker_id == worker_id]
-        if terminated:
-            term_session = terminated[-1]
+        term_session = self._terminated_by_worker.get(worker_id)
+        if term_session:
             return {
                 "status": "terminated",
                 "worker_id": term_session.worker_id,
@@ -2385,11 +2813,35 @@ class BrowserLauncher:
 
     async def shutdown(self):
         """Gracefully shutdown and wait for background tasks to complete"""
-        if self._background_tasks:
-            logger.info(
-                f"Waiting for {len(self._background_tasks)} background tasks to complete..."
-            )
-            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        # Snapshot: done-callbacks discard from the set while gather runs
+        pending = list(self._background_tasks)
+        if pending:
+            logger.info(f"Waiting for {len(pending)} background tasks to complete...")
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._profile_cleanup_workers:
+            try:
+                await asyncio.wait_for(self._profile_cleanup_queue.join(), timeout=30.0)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"{self._profile_cleanup_queue.qsize()} profile cleanups still "
+                    f"pending at shutdown"
+                )
+            for task in self._profile_cleanup_workers:
+                task.cancel()
+            await asyncio.gather(*self._profile_cleanup_workers, return_exceptions=True)
+            self._profile_cleanup_workers = []
+
+        await self._stop_windows_helper()
+
+        if self._netsh_worker_task is not None:
+            try:
+                await asyncio.wait_for(self._netsh_queue.join(), timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning("Portproxy removals still pending at shutdown")
+            self._netsh_worker_task.cancel()
+            await asyncio.gather(self._netsh_worker_task, return_exceptions=True)
+            self._netsh_worker_task = None
 
         try:
             http = getattr(self, "_http", None)
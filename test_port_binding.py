@@ -1,7 +1,29 @@
 """Test script to diagnose port binding issues on Windows"""
 
+import platform
+import re
 import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+# netstat lines with a local/remote port in 9220-9249
+_PORT_RANGE_RE = re.compile(r":(?:922|923|924)\d\b")
+
+_IS_WINDOWS = platform.system().lower() == "windows"
+
+
+def probe_socket():
+    """
+    TCP socket for bind probes. On Windows SO_REUSEADDR lets the bind succeed
+    even while another socket holds the port, so use SO_EXCLUSIVEADDRUSE there.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if _IS_WINDOWS:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    else:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    return sock
+
 
 print("=" * 60)
 print("PORT BINDING DIAGNOSTIC TEST")
@@ -12,80 +34,97 @@ port = 9220
 
 print(f"\n1. Testing port {port} with 0.0.0.0...")
 try:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.bind(("0.0.0.0", port))
+    with probe_socket() as sock:
+        sock.bind(("0.0.0.0", port))
     print(f"   ✓ SUCCESS: Port {port} is available on 0.0.0.0")
-    sock.close()
 except Exception as e:
     print(f"   ✗ FAILED: {type(e).__name__}: {e}")
 
 print(f"\n2. Testing port {port} with 127.0.0.1...")
 try:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.bind(("127.0.0.1", port))
+    with probe_socket() as sock:
+        sock.bind(("127.0.0.1", port))
     print(f"   ✓ SUCCESS: Port {port} is available on 127.0.0.1")
-    sock.close()
 except Exception as e:
     print(f"   ✗ FAILED: {type(e).__name__}: {e}")
 
 print(f"\n3. Testing port {port} with empty string ''...")
 try:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.bind(("", port))
+    with probe_socket() as sock:
+        sock.bind(("", port))
     print(f"   ✓ SUCCESS: Port {port} is available on ''")
-    sock.close()
 except Exception as e:
     print(f"   ✗ FAILED: {type(e).__name__}: {e}")
 
 print("\n4. Checking which ports in range 9220-9240 are in use...")
+
+
+def netstat_lines():
+    """Fallback when psutil is unavailable: grep the netstat -ano output"""
+    try:
+        result = subprocess.run(
+            ["netstat", "-ano"], capture_output=True, text=True, timeout=5
+        )
+    except subprocess.TimeoutExpired:
+        print("   ✗ netstat command timed out")
+        return None
+    except Exception as e:
+        print(f"   ✗ Error running netstat: {e}")
+        return None
+    return [
+        line.strip()
+        for line in result.stdout.split("\n")
+        if _PORT_RANGE_RE.search(line)
+    ]
+
+
 try:
-    result = subprocess.run(
-        ["netstat", "-ano"], capture_output=True, text=True, timeout=5
-    )
+    import psutil
+
+    # Reads the kernel TCP table directly (GetExtendedTcpTable on Windows)
     lines = [
-        line
-        for line in result.stdout.split("\n")
-        if ":922" in line or ":923" in line or ":924" in line
+        f"{c.laddr.ip}:{c.laddr.port}  {c.status}  pid={c.pid}"
+        for c in psutil.net_connections(kind="tcp")
+        if c.laddr and 9220 <= c.laddr.port <= 9240
     ]
-    if lines:
-        print(f"   Found {len(lines)} connections in port range:")
-        for line in lines[:15]:
-            print(f"   {line.strip()}")
-    else:
-        print("   ✓ No ports in 9220-9240 range are in use")
-except subprocess.TimeoutExpired:
-    print("   ✗ netstat command timed out")
+except ImportError:
+    lines = netstat_lines()
 except Exception as e:
-    print(f"   ✗ Error running netstat: {e}")
+    print(f"   psutil.net_connections failed ({e}), falling back to netstat")
+    lines = netstat_lines()
+
+if lines:
+    print(f"   Found {len(lines)} connections in port range:")
+    for line in lines[:15]:
+        print(f"   {line}")
+elif lines is not None:
+    print("   ✓ No ports in 9220-9240 range are in use")
 
 print("\n5. Testing the actual _check_port_free_async logic...")
 
 
 def check_port_free(port):
+    """Return (port, status) where status is FREE, BUSY - <err> or ERROR - <err>"""
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        try:
-            sock.bind(("0.0.0.0", port))
-            sock.close()
-            return True
-        except OSError as e:
-            sock.close()
-            print(f"   Port {port}: BUSY - {e}")
-            return False
+        with probe_socket() as sock:
+            try:
+                sock.bind(("0.0.0.0", port))
+                return port, "FREE"
+            except OSError as e:
+                return port, f"BUSY - {e}"
     except Exception as e:
-        print(f"   Port {port}: ERROR - {e}")
-        return False
+        return port, f"ERROR - {e}"
+
 
+# Probes are independent - run them in parallel, report in port order
+with ThreadPoolExecutor(max_workers=16) as executor:
+    results = list(executor.map(check_port_free, range(9220, 9225)))  # First 5 ports
 
 free_ports = []
-for test_port in range(9220, 9225):  # Test first 5 ports
-    if check_port_free(test_port):
+for test_port, status in results:
+    print(f"   Port {test_port}: {status}")
+    if status == "FREE":
         free_ports.append(test_port)
-        print(f"   Port {test_port}: FREE")
 
 if free_ports:
     print(f"\n   ✓ Found {len(free_ports)} free ports: {free_ports}")